@@ -0,0 +1,31 @@
+import math
+import re
+
+# key=value pairs accepted by the json commands
+KV_PATTERN = re.compile(r"([^\s=]+)=(\S+)")
+
+# Values accepted as booleans and numbers; ASCII only, so other scripts' digits stay text
+BOOLEAN_VALUES = {"true": True, "false": False}
+INT_PATTERN = re.compile(r"-?[0-9]+")
+FLOAT_PATTERN = re.compile(r"-?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?")
+
+
+def coerce_value(value):
+    """Convert a command-line value to int, float or bool, falling back to the string"""
+    if INT_PATTERN.fullmatch(value):
+        try:
+            return int(value)
+        except ValueError:
+            # Integers longer than sys.get_int_max_str_digits() are refused, so keep them as text
+            return value
+    if FLOAT_PATTERN.fullmatch(value):
+        number = float(value)
+        # Exponents past the float range overflow to infinity, which is not valid JSON
+        if math.isfinite(number):
+            return number
+    return BOOLEAN_VALUES.get(value.lower(), value)
+
+
+def parse_kv(text):
+    """Parse key=value pairs from a command line into a dict of coerced values"""
+    return {m.group(1): coerce_value(m.group(2)) for m in KV_PATTERN.finditer(text)}
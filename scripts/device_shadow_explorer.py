@@ -21,6 +21,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), "..", "i18n"))
 import boto3
 from awscrt import mqtt
 from awsiot import mqtt_connection_builder
+from kv_parser import coerce_value
 from language_selector import get_language
 from loader import load_messages
 
@@ -1109,16 +1110,7 @@ class DeviceShadowExplorer:
             print(get_message("property_value_required"))
             return
 
-        # Try to convert to appropriate type
-        try:
-            if property_value.lower() in ["true", "false"]:
-                property_value = property_value.lower() == "true"
-            elif property_value.isdigit():
-                property_value = int(property_value)
-            elif "." in property_value and property_value.replace(".", "").isdigit():
-                property_value = float(property_value)
-        except (ValueError, TypeError):
-            pass  # Keep as string
+        property_value = coerce_value(property_value)
 
         desired_state = {property_name: property_value}
 
@@ -1234,7 +1226,8 @@ class DeviceShadowExplorer:
             print(f"\n{get_message('message_history').format(len(self.received_messages))}")
 
             for i, msg in enumerate(self.received_messages[-10:], 1):  # Show last 10
-                timestamp = msg.get("Timestamp", "").split("T")[1][:8] if "T" in msg.get("Timestamp", "") else "Unknown"
+                iso_timestamp = msg.get("Timestamp", "")
+                timestamp = iso_timestamp[11:19] if "T" in iso_timestamp else "Unknown"
                 topic = msg.get("Topic", "Unknown")
                 topic_type = topic.split("/")[-1] if "/" in topic else topic
 
@@ -1396,20 +1389,10 @@ class DeviceShadowExplorer:
                     # Parse key=value pairs
                     desired_updates = {}
                     for pair in parts[1].split():
-                        if "=" in pair:
-                            key, value = pair.split("=", 1)
-                            # Try to convert to appropriate type
-                            try:
-                                if value.lower() in ["true", "false"]:
-                                    desired_updates[key] = value.lower() == "true"
-                                elif value.isdigit():
-                                    desired_updates[key] = int(value)
-                                elif "." in value and value.replace(".", "").isdigit():
-                                    desired_updates[key] = float(value)
-                                else:
-                                    desired_updates[key] = value
-                            except (ValueError, TypeError):
-                                desired_updates[key] = value
+                        key, sep, value = pair.partition("=")
+                        if not sep:
+                            continue
+                        desired_updates[key] = coerce_value(value)
 
                     if desired_updates:
                         print(get_message("setting_desired_state").format(json.dumps(desired_updates, indent=2)))
@@ -1430,7 +1413,7 @@ class DeviceShadowExplorer:
                     print(f"\n{get_message('shadow_message_history')}")
                     with self.message_lock:
                         for msg in self.received_messages[-10:]:  # Show last 10 messages
-                            timestamp = msg["Timestamp"].split("T")[1][:8]
+                            timestamp = msg["Timestamp"][11:19]
                             topic_type = msg["Topic"].split("/")[-1]
                             print(f"   📥 [{timestamp}] {topic_type}")
                             if msg.get("Shadow Data"):
@@ -1485,42 +1468,17 @@ class DeviceShadowExplorer:
                             new_value = input(get_message("new_value_prompt")).strip()
 
                             if new_value:
-                                # Try to convert to appropriate type
-                                try:
-                                    if new_value.lower() in ["true", "false"]:
-                                        local_state[key] = new_value.lower() == "true"
-                                    elif new_value.isdigit():
-                                        local_state[key] = int(new_value)
-                                    elif "." in new_value and new_value.replace(".", "").isdigit():
-                                        local_state[key] = float(new_value)
-                                    else:
-                                        local_state[key] = new_value
-                                    print(get_message("updated_key").format(key, local_state[key]))
-                                except (ValueError, TypeError):
-                                    local_state[key] = new_value
-                                    print(get_message("updated_key").format(key, local_state[key]))
+                                local_state[key] = coerce_value(new_value)
+                                print(get_message("updated_key").format(key, local_state[key]))
 
                         elif edit_choice == len(keys) + 1:
                             # Add new key
                             new_key = input(get_message("new_key_name")).strip()
                             if new_key:
                                 new_value = input(get_message("value_for_key").format(new_key)).strip()
-                                # Try to convert to appropriate type
-                                try:
-                                    if new_value.lower() in ["true", "false"]:
-                                        local_state[new_key] = new_value.lower() == "true"
-                                    elif new_value.isdigit():
-                                        local_state[new_key] = int(new_value)
-                                    elif "." in new_value and new_value.replace(".", "").isdigit():
-                                        local_state[new_key] = float(new_value)
-                                    else:
-                                        local_state[new_key] = new_value
-                                    print(get_message("added_new_key").format(new_key, local_state[new_key]))
-                                    keys.append(new_key)  # Update keys list
-                                except (ValueError, TypeError):
-                                    local_state[new_key] = new_value
-                                    print(get_message("added_new_key").format(new_key, local_state[new_key]))
-                                    keys.append(new_key)
+                                local_state[new_key] = coerce_value(new_value)
+                                print(get_message("added_new_key").format(new_key, local_state[new_key]))
+                                keys.append(new_key)  # Update keys list
 
                         elif edit_choice == len(keys) + 2:
                             # Done editing
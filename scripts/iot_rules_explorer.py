@@ -8,23 +8,62 @@ Educational tool for learning AWS IoT Rules Engine through hands-on rule creatio
 """
 import json
 import os
+import re
 import sys
 import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cached_property, lru_cache
 
 import boto3
 from awscrt import io, mqtt
 from awsiot import mqtt_connection_builder
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(obj, indent=False):
+    """Serialize to a JSON string, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None, default=str)
+
+
+def _truncated_dumps(obj, limit=500):
+    """Serialize compactly for debug output, keeping at most limit characters"""
+    if ORJSON_AVAILABLE:
+        # Slice the encoded bytes so the full payload is never decoded into a str
+        raw = orjson.dumps(obj, default=str)
+        text, truncated = raw[:limit].decode("utf-8", "ignore"), len(raw) > limit
+    else:
+        text = json.dumps(obj, default=str)
+        text, truncated = text[:limit], len(text) > limit
+    return text + ("..." if truncated else "")
+
+
+def _loads(data):
+    """Parse JSON from bytes or str, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 # Internationalization support
 def load_messages(lang="en"):
     """Load messages from i18n files"""
     try:
         script_dir = os.path.dirname(os.path.abspath(__file__))
         i18n_path = os.path.join(script_dir, "..", "i18n", lang, "iot_rules_explorer.json")
-        with open(i18n_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(i18n_path, "rb") as f:
+            return _loads(f.read())
     except FileNotFoundError:
         # Fallback to English
         if lang != "en":
@@ -32,21 +71,30 @@ def load_messages(lang="en"):
         return {}
 
 
+# AWS_IOT_LANG values (lowercased) mapped to language codes
+LANGUAGE_ALIASES = {
+    alias: code
+    for code, aliases in (
+        ("es", ("es", "spanish", "español")),
+        ("ja", ("ja", "japanese", "日本語", "jp")),
+        ("zh-CN", ("zh-cn", "chinese", "中文", "zh")),
+        ("pt-BR", ("pt-br", "portuguese", "português", "pt")),
+        ("ko", ("ko", "korean", "한국어", "kr")),
+        ("en", ("en", "english")),
+    )
+    for alias in aliases
+}
+
+# Interactive menu choices mapped to language codes
+LANGUAGE_CODES = {"1": "en", "2": "es", "3": "ja", "4": "zh-CN", "5": "pt-BR", "6": "ko"}
+
+
 def get_language():
     """Get user's preferred language"""
     env_lang = os.getenv("AWS_IOT_LANG", "").lower()
-    if env_lang in ["es", "spanish", "español"]:
-        return "es"
-    elif env_lang in ["ja", "japanese", "日本語", "jp"]:
-        return "ja"
-    elif env_lang in ["zh-cn", "chinese", "中文", "zh"]:
-        return "zh-CN"
-    elif env_lang in ["pt-br", "portuguese", "português", "pt"]:
-        return "pt-BR"
-    elif env_lang in ["ko", "korean", "한국어", "kr"]:
-        return "ko"
-    elif env_lang in ["en", "english"]:
-        return "en"
+    mapped = LANGUAGE_ALIASES.get(env_lang)
+    if mapped:
+        return mapped
 
     # Interactive selection
     print("🌍 Language Selection / Selección de Idioma / 言語選択 / 语言选择 / Seleção de Idioma / 언어 선택")
@@ -61,33 +109,96 @@ def get_language():
     while True:
         try:
             choice = input("Select language (1-6): ").strip()
-            if choice == "1":
-                return "en"
-            elif choice == "2":
-                return "es"
-            elif choice == "3":
-                return "ja"
-            elif choice == "4":
-                return "zh-CN"
-            elif choice == "5":
-                return "pt-BR"
-            elif choice == "6":
-                return "ko"
-            else:
-                print("Invalid choice. Please select 1-6.")
+            if choice in LANGUAGE_CODES:
+                return LANGUAGE_CODES[choice]
+            print("Invalid choice. Please select 1-6.")
         except KeyboardInterrupt:
             print("\nGoodbye!")
             sys.exit(0)
 
 
+# Splits a rule statement into its SELECT, FROM and WHERE parts in a single pass; quoted topics may contain spaces
+SQL_PARTS_PATTERN = re.compile(
+    r"^\s*SELECT\s+(?P<select>.*?)\s+FROM\s+(?P<from>'[^']+'|\"[^\"]+\"|\S+)(?:\s+WHERE\s+(?P<where>.*?))?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+@lru_cache(maxsize=256)
+def parse_rule_sql(sql):
+    """Return the (topic, where) parts of a rule SQL statement; missing parts are None"""
+    sql_parts = SQL_PARTS_PATTERN.match(sql or "")
+    if not sql_parts:
+        return None, None
+    return sql_parts.group("from").strip("'\""), sql_parts.group("where") or None
+
+
+WhereCondition = namedtuple("WhereCondition", ["field", "op", "threshold", "literal"])
+
+
+@lru_cache(maxsize=64)
+def compile_where_condition(where_condition):
+    """Reduce a WHERE clause to the field, operator, threshold and literal used to build test messages"""
+    condition_lower = where_condition.lower()
+
+    if "temperature" in condition_lower:
+        field = "temperature"
+    elif "humidity" in condition_lower:
+        field = "humidity"
+    elif "status" in condition_lower:
+        field = "status"
+    elif "level" in condition_lower or "battery" in condition_lower:
+        field = "level"
+    else:
+        field = None
+
+    if field == "level":
+        op = "<" if "<" in condition_lower else None
+    else:
+        op = ">" if ">" in condition_lower else "<" if "<" in condition_lower else None
+
+    threshold = None
+    if op:
+        try:
+            threshold = float(condition_lower.split(op)[1].strip())
+        except (ValueError, IndexError):
+            pass
+
+    has_active = "'active'" in condition_lower or '"active"' in condition_lower
+    has_offline = "'offline'" in condition_lower or '"offline"' in condition_lower
+    literal = "offline" if has_offline and not has_active else "active"
+
+    return WhereCondition(field, op, threshold, literal)
+
+
+# Comment markers, statement separators and data-modifying keywords rejected in user-supplied clauses
+DANGEROUS_SQL_PATTERN = re.compile(r"--|/\*|\*/|;|DROP|DELETE|INSERT|UPDATE|EXEC", re.IGNORECASE)
+
+# Shared AWS client configuration: a larger pool and TCP keep-alive let repeated
+# control plane calls (one get_topic_rule per rule) reuse open connections
+CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={"mode": "adaptive", "max_attempts": 3},
+    connect_timeout=5,
+    read_timeout=30,
+)
+
 # Global variables
 USER_LANG = get_language()
 MESSAGES = load_messages(USER_LANG)
+_MGET = MESSAGES.get
+
+
+@lru_cache(maxsize=None)
+def _msg_static(key):
+    """Resolve a message key once; MESSAGES does not change after import"""
+    return _MGET(key, key)
 
 
 def get_message(key, **kwargs):
     """Get localized message"""
-    message = MESSAGES.get(key, key)
+    message = _msg_static(key)
     if kwargs:
         try:
             return message.format(**kwargs)
@@ -96,28 +207,61 @@ def get_message(key, **kwargs):
     return message
 
 
+# Placeholder for fields missing from rule payloads
+NOT_AVAILABLE = "N/A"
+
+# Frequently printed messages, resolved once after MESSAGES is loaded
+HEADER_SEPARATOR = get_message("header_separator")
+RULE_SEPARATOR = get_message("rule_separator")
+NO_RULES_FOUND = get_message("no_rules_found")
+ENTER_VALID_NUMBER = get_message("enter_valid_number")
+
+
 class IoTRulesExplorer:
+    # Event-specific fields for example messages; each builder receives the rule SQL statement
+    EXAMPLE_FIELD_BUILDERS = {
+        "temperature": lambda sql: {"temperature": 30.0 if "temperature >" in sql else 25.5},
+        "humidity": lambda sql: {"humidity": 85.0 if "humidity >" in sql else 65.0},
+        "pressure": lambda sql: {"pressure": 1020.0 if "pressure >" in sql else 1013.25},
+        "motion": lambda sql: {"detected": True},
+        "door": lambda sql: {"status": "open"},
+        "alarm": lambda sql: {"alertType": "fire", "severity": "high"},
+        "status": lambda sql: {"status": "active", "uptime": 3600},
+        "battery": lambda sql: {"level": 15 if "level <" in sql else 85, "voltage": 3.2},
+    }
+
+    # Fields shared by every rule test message; the timestamp is added per message
+    TEST_MESSAGE_TEMPLATE = {"deviceId": "test-device-123"}
+
     def __init__(self, debug=False):
-        self.iot = boto3.client("iot")
-        self.iam = boto3.client("iam")
+        session = boto3.Session()
+        self.iot = session.client("iot", config=CLIENT_CONFIG)
+        self.iam = session.client("iam", config=CLIENT_CONFIG)
         self.debug_mode = debug
         self.rule_role_name = "IoTRulesEngineRole"
+        self._role_arn = None
+        self._endpoint = None
+
+    @cached_property
+    def client_bootstrap(self):
+        """MQTT client bootstrap, created on first use and shared by every test session"""
+        event_loop_group = io.EventLoopGroup(1)
+        host_resolver = io.DefaultHostResolver(event_loop_group)
+        return io.ClientBootstrap(event_loop_group, host_resolver)
 
     def safe_operation(self, func, operation_name, **kwargs):
         """Execute operation with error handling"""
         try:
             if self.debug_mode:
                 print(get_message("debug_operation", operation=operation_name))
-                print(get_message("debug_input", input=json.dumps(kwargs, indent=2, default=str)))
+                print(get_message("debug_input", input=_dumps(kwargs, indent=True)))
 
             response = func(**kwargs)
 
             if self.debug_mode:
                 print(get_message("debug_completed", operation=operation_name))
                 if response:
-                    output_str = json.dumps(response, indent=2, default=str)
-                    truncated_output = output_str[:500] + ("..." if len(output_str) > 500 else "")
-                    print(get_message("debug_output", output=truncated_output))
+                    print(get_message("debug_output", output=_truncated_dumps(response)))
 
             return response, True
         except ClientError as e:
@@ -140,8 +284,6 @@ class IoTRulesExplorer:
         if not clause:
             return ""
 
-        import re
-
         if clause_type == "SELECT":
             allowed_pattern = r"^[a-zA-Z0-9_\s,.*()=<>!+'-]+$"
         elif clause_type == "WHERE":
@@ -152,27 +294,16 @@ class IoTRulesExplorer:
         if not re.match(allowed_pattern, clause):
             raise ValueError(get_message("invalid_characters_clause", clause_type=clause_type))
 
-        dangerous_patterns = [
-            "--",
-            "/*",
-            "*/",
-            ";",
-            "DROP",
-            "DELETE",
-            "INSERT",
-            "UPDATE",
-            "EXEC",
-        ]
-        clause_upper = clause.upper()
-        for pattern in dangerous_patterns:
-            if pattern in clause_upper:
-                raise ValueError(
-                    get_message(
-                        "dangerous_pattern_detected",
-                        pattern=pattern,
-                        clause_type=clause_type,
-                    )
+        # One case-insensitive scan instead of upper-casing the clause and testing each pattern
+        dangerous_match = DANGEROUS_SQL_PATTERN.search(clause)
+        if dangerous_match:
+            raise ValueError(
+                get_message(
+                    "dangerous_pattern_detected",
+                    pattern=dangerous_match.group().upper(),
+                    clause_type=clause_type,
                 )
+            )
 
         return clause.strip()
 
@@ -181,8 +312,6 @@ class IoTRulesExplorer:
         if not topic:
             return ""
 
-        import re
-
         allowed_pattern = r"^[a-zA-Z0-9_/+-]+$"
 
         if not re.match(allowed_pattern, topic):
@@ -190,85 +319,104 @@ class IoTRulesExplorer:
 
         return topic.strip()
 
+    def iter_rules(self):
+        """Yield every IoT rule, following list_topic_rules pagination"""
+        paginator = self.iot.get_paginator("list_topic_rules")
+        for page in paginator.paginate(PaginationConfig={"PageSize": 250}):
+            yield from page.get("rules", [])
+
     def list_rules(self):
         """List all IoT rules"""
         print(f"\n{get_message('list_rules_title')}")
-        print(get_message("header_separator"))
+        print(HEADER_SEPARATOR)
 
-        response, success = self.safe_operation(self.iot.list_topic_rules, get_message("list_rules_title"))
+        rules, success = self.safe_operation(lambda: list(self.iter_rules()), get_message("list_rules_title"))
         if not success:
             return
 
-        rules = response.get("rules", [])
         if not rules:
-            print(get_message("no_rules_found"))
+            print(NO_RULES_FOUND)
             print(get_message("create_first_rule"))
             return
 
         print(get_message("found_rules", count=len(rules)))
         print()
 
-        for i, rule in enumerate(rules, 1):
+        # Fetch rule details concurrently (boto3 clients are thread-safe); map keeps rule order.
+        # Debug mode stays sequential so the per-call debug output is not interleaved.
+        max_workers = 1 if self.debug_mode else min(16, len(rules))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            details = list(
+                executor.map(
+                    lambda rule: self.safe_operation(
+                        self.iot.get_topic_rule,
+                        f"Get rule details for {rule['ruleName']}",
+                        ruleName=rule["ruleName"],
+                    ),
+                    rules,
+                )
+            )
+
+        enabled_label = get_message("rule_status_enabled")
+        disabled_label = get_message("rule_status_disabled")
+
+        # Build the listing first and write it in one call
+        lines = []
+        for i, (rule, (rule_response, rule_success)) in enumerate(zip(rules, details), 1):
             rule_name = rule["ruleName"]
             created_at = rule.get("createdAt", "Unknown")
-            rule_disabled = rule.get("ruleDisabled", False)
-            status = get_message("rule_status_disabled") if rule_disabled else get_message("rule_status_enabled")
+            status = disabled_label if rule.get("ruleDisabled", False) else enabled_label
 
-            print(f"{i}. {rule_name} - {status}")
-            print(f"   {get_message('created_label', date=created_at)}")
+            lines.append(f"{i}. {rule_name} - {status}")
+            lines.append(f"   {get_message('created_label', date=created_at)}")
 
             if self.debug_mode:
-                print(f"   {get_message('debug_rule_arn', arn=rule.get('ruleArn', 'N/A'))}")
-
-            rule_response, rule_success = self.safe_operation(
-                self.iot.get_topic_rule,
-                f"Get rule details for {rule_name}",
-                ruleName=rule_name,
-            )
+                lines.append(f"   {get_message('debug_rule_arn', arn=rule.get('ruleArn', NOT_AVAILABLE))}")
 
             if rule_success and rule_response:
                 rule_payload = rule_response.get("rule", {})
-                sql = rule_payload.get("sql", "N/A")
+                sql = rule_payload.get("sql", NOT_AVAILABLE)
                 actions = rule_payload.get("actions", [])
 
-                print(f"   {get_message('sql_label', sql=sql)}")
-                print(f"   {get_message('actions_count', count=len(actions))}")
+                lines.append(f"   {get_message('sql_label', sql=sql)}")
+                lines.append(f"   {get_message('actions_count', count=len(actions))}")
 
                 for j, action in enumerate(actions, 1):
                     if "republish" in action:
-                        topic = action["republish"].get("topic", "N/A")
-                        print(f"      {j}. {get_message('action_republish', topic=topic)}")
+                        topic = action["republish"].get("topic", NOT_AVAILABLE)
+                        lines.append(f"      {j}. {get_message('action_republish', topic=topic)}")
                     elif "s3" in action:
-                        bucket = action["s3"].get("bucketName", "N/A")
-                        print(f"      {j}. {get_message('action_s3', bucket=bucket)}")
+                        bucket = action["s3"].get("bucketName", NOT_AVAILABLE)
+                        lines.append(f"      {j}. {get_message('action_s3', bucket=bucket)}")
                     elif "lambda" in action:
-                        function_arn = action["lambda"].get("functionArn", "N/A")
+                        function_arn = action["lambda"].get("functionArn", NOT_AVAILABLE)
                         function_name = function_arn.split(":")[-1] if ":" in function_arn else function_arn
-                        print(f"      {j}. {get_message('action_lambda', function=function_name)}")
+                        lines.append(f"      {j}. {get_message('action_lambda', function=function_name)}")
                     else:
-                        action_type = list(action.keys())[0] if action else "Unknown"
-                        print(f"      {j}. {action_type}")
-            print()
+                        action_type = next(iter(action), "Unknown")
+                        lines.append(f"      {j}. {action_type}")
+            lines.append("")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def describe_rule(self):
         """Describe a specific IoT rule"""
         print(f"\n{get_message('describe_rule_title')}")
-        print(get_message("header_separator"))
+        print(HEADER_SEPARATOR)
 
-        response, success = self.safe_operation(self.iot.list_topic_rules, get_message("list_rules_for_selection"))
+        rules, success = self.safe_operation(lambda: list(self.iter_rules()), get_message("list_rules_for_selection"))
         if not success:
             return
 
-        rules = response.get("rules", [])
         if not rules:
-            print(get_message("no_rules_found"))
+            print(NO_RULES_FOUND)
             return
 
         print(get_message("available_rules"))
+        enabled_label = get_message("rule_status_enabled")
+        disabled_label = get_message("rule_status_disabled")
         for i, rule in enumerate(rules, 1):
-            status = (
-                get_message("rule_status_disabled") if rule.get("ruleDisabled", False) else get_message("rule_status_enabled")
-            )
+            status = disabled_label if rule.get("ruleDisabled", False) else enabled_label
             print(f"   {i}. {rule['ruleName']} - {status}")
 
         while True:
@@ -280,7 +428,7 @@ class IoTRulesExplorer:
                 else:
                     print(get_message("invalid_selection_range", count=len(rules)))
             except ValueError:
-                print(get_message("enter_valid_number"))
+                print(ENTER_VALID_NUMBER)
 
         rule_response, rule_success = self.safe_operation(
             self.iot.get_topic_rule,
@@ -293,65 +441,60 @@ class IoTRulesExplorer:
 
         rule_payload = rule_response.get("rule", {})
 
-        print(f"\n{get_message('rule_details_title', name=selected_rule)}")
-        print(get_message("rule_separator"))
+        # Build the rule description first and write it in one call
+        lines = []
+        lines.append(f"\n{get_message('rule_details_title', name=selected_rule)}")
+        lines.append(RULE_SEPARATOR)
 
-        print(get_message("sql_statement_label"))
-        print(f"   {rule_payload.get('sql', 'N/A')}")
-
-        print(f"\n{get_message('sql_breakdown_label')}")
+        lines.append(get_message("sql_statement_label"))
         sql = rule_payload.get("sql", "")
-        if "SELECT" in sql.upper():
-            select_part = sql.split("FROM")[0].replace("SELECT", "").strip()
-            print(f"   {get_message('select_clause', clause=select_part)}")
-
-        if "FROM" in sql.upper():
-            from_part = (
-                sql.split("FROM")[1].split("WHERE")[0].strip() if "WHERE" in sql.upper() else sql.split("FROM")[1].strip()
-            )
-            print(f"   {get_message('from_clause', clause=from_part)}")
-
-        if "WHERE" in sql.upper():
-            where_part = sql.split("WHERE")[1].strip()
-            print(f"   {get_message('where_clause', clause=where_part)}")
+        lines.append(f"   {sql or NOT_AVAILABLE}")
+
+        lines.append(f"\n{get_message('sql_breakdown_label')}")
+        sql_parts = SQL_PARTS_PATTERN.match(sql)
+        if sql_parts:
+            lines.append(f"   {get_message('select_clause', clause=sql_parts.group('select'))}")
+            lines.append(f"   {get_message('from_clause', clause=sql_parts.group('from'))}")
+            if sql_parts.group("where"):
+                lines.append(f"   {get_message('where_clause', clause=sql_parts.group('where'))}")
+        elif sql:
+            lines.append(f"   {sql}")
 
         actions = rule_payload.get("actions", [])
-        print(f"\n{get_message('actions_title', count=len(actions))}")
+        lines.append(f"\n{get_message('actions_title', count=len(actions))}")
 
         for i, action in enumerate(actions, 1):
-            action_type = list(action.keys())[0] if action else "Unknown"
-            print(f"   {i}. {get_message('action_type', type=action_type)}")
+            action_type = next(iter(action), "Unknown")
+            lines.append(f"   {i}. {get_message('action_type', type=action_type)}")
 
             if "republish" in action:
                 republish = action["republish"]
-                print(f"      {get_message('target_topic', topic=republish.get('topic', 'N/A'))}")
-                print(f"      {get_message('role_arn', arn=republish.get('roleArn', 'N/A'))}")
+                lines.append(f"      {get_message('target_topic', topic=republish.get('topic', NOT_AVAILABLE))}")
+                lines.append(f"      {get_message('role_arn', arn=republish.get('roleArn', NOT_AVAILABLE))}")
                 if "qos" in republish:
-                    print(f"      {get_message('qos_label', qos=republish['qos'])}")
+                    lines.append(f"      {get_message('qos_label', qos=republish['qos'])}")
 
         error_action = rule_payload.get("errorAction")
         if error_action:
-            print(f"\n{get_message('error_action_title')}")
-            error_type = list(error_action.keys())[0] if error_action else "Unknown"
-            print(f"   {get_message('error_action_type', type=error_type)}")
-
-        print(f"\n{get_message('rule_metadata_title')}")
-        status = (
-            get_message("rule_status_disabled")
-            if rule_payload.get("ruleDisabled", False)
-            else get_message("rule_status_enabled")
-        )
-        print(f"   {get_message('rule_status', status=status)}")
-        print(f"   {get_message('rule_created', date=rule_payload.get('createdAt', 'N/A'))}")
+            lines.append(f"\n{get_message('error_action_title')}")
+            error_type = next(iter(error_action), "Unknown")
+            lines.append(f"   {get_message('error_action_type', type=error_type)}")
+
+        lines.append(f"\n{get_message('rule_metadata_title')}")
+        status = disabled_label if rule_payload.get("ruleDisabled", False) else enabled_label
+        lines.append(f"   {get_message('rule_status', status=status)}")
+        lines.append(f"   {get_message('rule_created', date=rule_payload.get('createdAt', NOT_AVAILABLE))}")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
         if self.debug_mode:
             print(f"\n{get_message('debug_complete_payload')}")
-            print(json.dumps(rule_payload, indent=2, default=str))
+            print(_dumps(rule_payload, indent=True))
 
     def create_rule(self):
         """Interactive rule creation"""
         print(f"\n{get_message('create_rule_title')}")
-        print(get_message("header_separator"))
+        print(HEADER_SEPARATOR)
 
         print(get_message("create_learning_objectives"))
         print(get_message("objective_sql_syntax"))
@@ -394,7 +537,7 @@ class IoTRulesExplorer:
                 else:
                     print(get_message("invalid_choice"))
             except ValueError:
-                print(get_message("enter_valid_number"))
+                print(ENTER_VALID_NUMBER)
 
         if topic_choice == 1:
             event_types = [
@@ -428,7 +571,7 @@ class IoTRulesExplorer:
                     else:
                         print(get_message("invalid_event_selection"))
                 except ValueError:
-                    print(get_message("enter_valid_number"))
+                    print(ENTER_VALID_NUMBER)
 
             topic_pattern = f"testRulesEngineTopic/+/{selected_event_type}"
         else:
@@ -502,7 +645,7 @@ class IoTRulesExplorer:
                 else:
                     print(get_message("invalid_event_selection"))
             except ValueError:
-                print(get_message("enter_valid_number"))
+                print(ENTER_VALID_NUMBER)
 
         print(get_message("select_clause_confirmed", clause=select_clause))
 
@@ -599,7 +742,7 @@ class IoTRulesExplorer:
 
         if self.debug_mode:
             print(get_message("debug_rule_payload"))
-            print(json.dumps(rule_payload, indent=2))
+            print(_dumps(rule_payload, indent=True))
 
         # Try creating with retry for IAM propagation
         max_retries = 3
@@ -641,36 +784,28 @@ class IoTRulesExplorer:
             print(f"   {get_message('testing_step_3')}")
 
             print(f"\n{get_message('example_test_message')}")
-            example_message = self.generate_example_message(selected_event_type, sql_statement)
-            print(f"   {json.dumps(example_message, indent=2)}")
+            now_ms = int(time.time() * 1000)
+            example_message = self.generate_example_message(selected_event_type, sql_statement, now_ms=now_ms)
+            print(f"   {_dumps(example_message, indent=True)}")
 
-    def generate_example_message(self, event_type, sql_statement):
+    def generate_example_message(self, event_type, sql_statement, now_ms=None):
         """Generate example message based on event type and SQL"""
-        base_message = {"deviceId": "device123", "timestamp": int(time.time() * 1000)}
-
-        if event_type == "temperature":
-            base_message["temperature"] = 30.0 if "temperature >" in sql_statement else 25.5
-        elif event_type == "humidity":
-            base_message["humidity"] = 85.0 if "humidity >" in sql_statement else 65.0
-        elif event_type == "pressure":
-            base_message["pressure"] = 1020.0 if "pressure >" in sql_statement else 1013.25
-        elif event_type == "motion":
-            base_message["detected"] = True
-        elif event_type == "door":
-            base_message["status"] = "open"
-        elif event_type == "alarm":
-            base_message.update({"alertType": "fire", "severity": "high"})
-        elif event_type == "status":
-            base_message.update({"status": "active", "uptime": 3600})
-        elif event_type == "battery":
-            base_message.update({"level": 15 if "level <" in sql_statement else 85, "voltage": 3.2})
-        else:
-            base_message.update({"value": 25.5, "status": "active"})
+        if now_ms is None:
+            now_ms = int(time.time() * 1000)
+        base_message = {"deviceId": "device123", "timestamp": now_ms}
+
+        builder = self.EXAMPLE_FIELD_BUILDERS.get(event_type)
+        base_message.update(builder(sql_statement) if builder else {"value": 25.5, "status": "active"})
 
         return base_message
 
     def ensure_iot_rule_role(self):
         """Create or verify IAM role for IoT Rules Engine"""
+        # The role ARN does not change during a session, so only look it up once
+        if self._role_arn:
+            print(get_message("using_existing_role", name=self.rule_role_name))
+            return self._role_arn
+
         try:
             response = self.iam.get_role(RoleName=self.rule_role_name)
             role_arn = response["Role"]["Arn"]
@@ -679,12 +814,14 @@ class IoTRulesExplorer:
                 print(get_message("debug_existing_role", arn=role_arn))
 
             print(get_message("using_existing_role", name=self.rule_role_name))
+            self._role_arn = role_arn
             return role_arn
 
         except ClientError as e:
             if e.response["Error"]["Code"] == "NoSuchEntity":
                 print(get_message("creating_iam_role", name=self.rule_role_name))
-                return self.create_iot_rule_role()
+                self._role_arn = self.create_iot_rule_role()
+                return self._role_arn
             else:
                 print(get_message("error_checking_role", error=e.response["Error"]["Message"]))
                 return None
@@ -706,7 +843,7 @@ class IoTRulesExplorer:
             self.iam.create_role,
             get_message("create_iam_role_operation", name=self.rule_role_name),
             RoleName=self.rule_role_name,
-            AssumeRolePolicyDocument=json.dumps(trust_policy),
+            AssumeRolePolicyDocument=_dumps(trust_policy),
             Description="IAM role for AWS IoT Rules Engine learning exercises",
         )
 
@@ -726,7 +863,7 @@ class IoTRulesExplorer:
             self.iam.create_policy,
             get_message("create_iam_policy_operation", name=policy_name),
             PolicyName=policy_name,
-            PolicyDocument=json.dumps(policy_document),
+            PolicyDocument=_dumps(policy_document),
             Description="Policy for IoT Rules Engine to publish messages",
         )
 
@@ -751,22 +888,21 @@ class IoTRulesExplorer:
     def manage_rule(self):
         """Enable, disable, or delete rules"""
         print(f"\n{get_message('manage_rule_title')}")
-        print(get_message("header_separator"))
+        print(HEADER_SEPARATOR)
 
-        response, success = self.safe_operation(self.iot.list_topic_rules, get_message("list_rules_for_management"))
+        rules, success = self.safe_operation(lambda: list(self.iter_rules()), get_message("list_rules_for_management"))
         if not success:
             return
 
-        rules = response.get("rules", [])
         if not rules:
-            print(get_message("no_rules_found"))
+            print(NO_RULES_FOUND)
             return
 
         print(get_message("available_rules"))
+        enabled_label = get_message("rule_status_enabled")
+        disabled_label = get_message("rule_status_disabled")
         for i, rule in enumerate(rules, 1):
-            status = (
-                get_message("rule_status_disabled") if rule.get("ruleDisabled", False) else get_message("rule_status_enabled")
-            )
+            status = disabled_label if rule.get("ruleDisabled", False) else enabled_label
             print(f"   {i}. {rule['ruleName']} - {status}")
 
         while True:
@@ -778,13 +914,13 @@ class IoTRulesExplorer:
                 else:
                     print(get_message("invalid_selection_range", count=len(rules)))
             except ValueError:
-                print(get_message("enter_valid_number"))
+                print(ENTER_VALID_NUMBER)
 
         rule_name = selected_rule["ruleName"]
         is_disabled = selected_rule.get("ruleDisabled", False)
 
         print(f"\n{get_message('managing_rule', name=rule_name)}")
-        current_status = get_message("rule_status_disabled") if is_disabled else get_message("rule_status_enabled")
+        current_status = disabled_label if is_disabled else enabled_label
         print(f"{get_message('current_status', status=current_status)}")
 
         print(f"\n{get_message('management_options')}")
@@ -803,7 +939,7 @@ class IoTRulesExplorer:
                 else:
                     print(get_message("invalid_action_selection"))
             except ValueError:
-                print(get_message("enter_valid_number"))
+                print(ENTER_VALID_NUMBER)
 
         if action == 1:
             # Enable/Disable rule
@@ -823,18 +959,15 @@ class IoTRulesExplorer:
             if rule_success:
                 current_rule = rule_response["rule"]
 
+                # replace_topic_rule only accepts payload fields, so copy those that get_topic_rule returned
                 clean_payload = {
-                    "sql": current_rule.get("sql", 'SELECT * FROM "temp"'),
-                    "ruleDisabled": new_disabled_status,
-                    "actions": current_rule.get("actions", []),
+                    key: current_rule[key]
+                    for key in ("sql", "actions", "description", "awsIotSqlVersion", "errorAction")
+                    if key in current_rule
                 }
-
-                if "description" in current_rule:
-                    clean_payload["description"] = current_rule["description"]
-                if "awsIotSqlVersion" in current_rule:
-                    clean_payload["awsIotSqlVersion"] = current_rule["awsIotSqlVersion"]
-                if "errorAction" in current_rule:
-                    clean_payload["errorAction"] = current_rule["errorAction"]
+                clean_payload.setdefault("sql", 'SELECT * FROM "temp"')
+                clean_payload.setdefault("actions", [])
+                clean_payload["ruleDisabled"] = new_disabled_status
 
                 response, success = self.safe_operation(
                     self.iot.replace_topic_rule,
@@ -844,9 +977,7 @@ class IoTRulesExplorer:
                 )
 
                 if success:
-                    status_text = (
-                        get_message("rule_status_enabled") if not new_disabled_status else get_message("rule_status_disabled")
-                    )
+                    status_text = disabled_label if new_disabled_status else enabled_label
                     print(get_message("rule_status_updated", name=rule_name, status=status_text))
             else:
                 print(get_message("failed_get_rule_settings", name=rule_name))
@@ -873,7 +1004,7 @@ class IoTRulesExplorer:
     def test_rule(self):
         """Test IoT rules with sample messages"""
         print(f"\n{get_message('test_rule_title')}")
-        print(get_message("header_separator"))
+        print(HEADER_SEPARATOR)
 
         print(get_message("test_learning_objectives"))
         print(get_message("test_objective_1"))
@@ -882,21 +1013,20 @@ class IoTRulesExplorer:
         print(get_message("test_objective_4"))
         print()
 
-        response, success = self.safe_operation(self.iot.list_topic_rules, get_message("list_rules_for_testing"))
+        rules, success = self.safe_operation(lambda: list(self.iter_rules()), get_message("list_rules_for_testing"))
         if not success:
             return
 
-        rules = response.get("rules", [])
         if not rules:
             print(get_message("no_rules_for_testing"))
             print(get_message("create_rule_first"))
             return
 
         print(get_message("available_rules"))
+        enabled_label = get_message("rule_status_enabled")
+        disabled_label = get_message("rule_status_disabled")
         for i, rule in enumerate(rules, 1):
-            status = (
-                get_message("rule_status_disabled") if rule.get("ruleDisabled", False) else get_message("rule_status_enabled")
-            )
+            status = disabled_label if rule.get("ruleDisabled", False) else enabled_label
             print(f"   {i}. {rule['ruleName']} - {status}")
 
         while True:
@@ -908,7 +1038,7 @@ class IoTRulesExplorer:
                 else:
                     print(get_message("invalid_selection_range", count=len(rules)))
             except ValueError:
-                print(get_message("enter_valid_number"))
+                print(ENTER_VALID_NUMBER)
 
         rule_name = selected_rule["ruleName"]
 
@@ -927,8 +1057,7 @@ class IoTRulesExplorer:
         print(f"\n{get_message('testing_rule', name=rule_name)}")
         print(get_message("sql_display", sql=sql_statement))
 
-        topic_pattern = self.extract_topic_from_sql(sql_statement)
-        where_condition = self.extract_where_from_sql(sql_statement)
+        topic_pattern, where_condition = parse_rule_sql(sql_statement)
 
         if topic_pattern:
             print(get_message("source_topic_pattern", pattern=topic_pattern))
@@ -948,19 +1077,21 @@ class IoTRulesExplorer:
         if not selected_device:
             return
 
-        endpoint_response, endpoint_success = self.safe_operation(
-            self.iot.describe_endpoint,
-            get_message("get_iot_endpoint"),
-            endpointType="iot:Data-ATS",
-        )
+        if not self._endpoint:
+            endpoint_response, endpoint_success = self.safe_operation(
+                self.iot.describe_endpoint,
+                get_message("get_iot_endpoint"),
+                endpointType="iot:Data-ATS",
+            )
 
-        if not endpoint_success:
-            print(get_message("cannot_get_endpoint"))
-            return
+            if not endpoint_success:
+                print(get_message("cannot_get_endpoint"))
+                return
+
+            self._endpoint = endpoint_response["endpointAddress"]
 
-        endpoint = endpoint_response["endpointAddress"]
         self.run_rule_testing(
-            endpoint,
+            self._endpoint,
             selected_device,
             rule_name,
             topic_pattern,
@@ -970,26 +1101,11 @@ class IoTRulesExplorer:
 
     def extract_topic_from_sql(self, sql):
         """Extract topic pattern from SQL FROM clause"""
-        try:
-            if "FROM" in sql.upper():
-                from_part = (
-                    sql.split("FROM")[1].split("WHERE")[0].strip() if "WHERE" in sql.upper() else sql.split("FROM")[1].strip()
-                )
-                topic = from_part.strip("'\"")
-                return topic
-        except (IndexError, AttributeError):
-            pass
-        return None
+        return parse_rule_sql(sql)[0]
 
     def extract_where_from_sql(self, sql):
         """Extract WHERE condition from SQL"""
-        try:
-            if "WHERE" in sql.upper():
-                where_part = sql.split("WHERE")[1].strip()
-                return where_part
-        except (IndexError, AttributeError):
-            pass
-        return None
+        return parse_rule_sql(sql)[1]
 
     def select_device_with_certificates(self):
         """Select device with certificates"""
@@ -1002,19 +1118,27 @@ class IoTRulesExplorer:
             return None
 
         available_devices = []
-        for thing_dir in os.listdir(cert_dir):
-            thing_path = os.path.join(cert_dir, thing_dir)
-            if os.path.isdir(thing_path):
-                cert_files = [f for f in os.listdir(thing_path) if f.endswith(".crt")]
+        # scandir entries carry their file type, so no extra stat calls are needed per device
+        with os.scandir(cert_dir) as thing_entries:
+            for thing_entry in thing_entries:
+                if not thing_entry.is_dir():
+                    continue
+                cert_files = []
+                key_paths = {}
+                with os.scandir(thing_entry.path) as file_entries:
+                    for file_entry in file_entries:
+                        if file_entry.name.endswith(".crt"):
+                            cert_files.append(file_entry)
+                        elif file_entry.name.endswith(".key"):
+                            key_paths[file_entry.name[:-4]] = file_entry.path
                 if cert_files:
-                    cert_id = cert_files[0].replace(".crt", "")
-                    cert_path = os.path.join(thing_path, f"{cert_id}.crt")
-                    key_path = os.path.join(thing_path, f"{cert_id}.key")
-                    if os.path.exists(key_path):
+                    cert_id = cert_files[0].name[:-4]
+                    key_path = key_paths.get(cert_id)
+                    if key_path:
                         available_devices.append(
                             {
-                                "thing_name": thing_dir,
-                                "cert_path": cert_path,
+                                "thing_name": thing_entry.name,
+                                "cert_path": cert_files[0].path,
                                 "key_path": key_path,
                                 "cert_id": cert_id,
                             }
@@ -1043,7 +1167,7 @@ class IoTRulesExplorer:
                     else:
                         print(get_message("invalid_device_selection"))
                 except ValueError:
-                    print(get_message("enter_valid_number"))
+                    print(ENTER_VALID_NUMBER)
 
         return selected_device
 
@@ -1061,30 +1185,24 @@ class IoTRulesExplorer:
         print(get_message("connecting_to_endpoint", endpoint=endpoint))
         print(get_message("using_device_info", device=device_info["thing_name"]))
 
-        event_loop_group = io.EventLoopGroup(1)
-        host_resolver = io.DefaultHostResolver(event_loop_group)
-        client_bootstrap = io.ClientBootstrap(event_loop_group, host_resolver)
-
-        messages_received = []
+        # Total outputs received, so each test can count what arrived after its own publish
+        received_total = 0
 
         def on_message_received(topic, payload, dup, qos, retain, **kwargs):
+            nonlocal received_total
             timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-            message_data = {
-                "timestamp": timestamp,
-                "topic": topic,
-                "payload": payload.decode("utf-8"),
-            }
-            messages_received.append(message_data)
+            decoded = payload.decode("utf-8")
+            received_total += 1
             print(f"\n{get_message('rule_output_received', timestamp=timestamp)}")
             print(get_message("message_topic", topic=topic))
-            print(get_message("message_content", message=payload.decode("utf-8")))
+            print(get_message("message_content", message=decoded))
             print(get_message("rule_processed_forwarded", name=rule_name))
 
         mqtt_connection = mqtt_connection_builder.mtls_from_path(
             endpoint=endpoint,
             cert_filepath=device_info["cert_path"],
             pri_key_filepath=device_info["key_path"],
-            client_bootstrap=client_bootstrap,
+            client_bootstrap=self.client_bootstrap,
             client_id=f"rule-tester-{device_info['thing_name']}",
             clean_session=False,
             keep_alive_secs=30,
@@ -1102,12 +1220,12 @@ class IoTRulesExplorer:
             connect_future.result(timeout=10)
             print(get_message("connected_aws_iot"))
 
-            for topic in target_topics:
-                subscribe_future, _ = mqtt_connection.subscribe(
-                    topic=topic,
-                    qos=mqtt.QoS.AT_LEAST_ONCE,
-                    callback=on_message_received,
-                )
+            # Send every SUBSCRIBE before waiting so the acknowledgements arrive together
+            subscriptions = [
+                (topic, mqtt_connection.subscribe(topic=topic, qos=mqtt.QoS.AT_LEAST_ONCE, callback=on_message_received)[0])
+                for topic in target_topics
+            ]
+            for topic, subscribe_future in subscriptions:
                 subscribe_future.result(timeout=10)
                 print(get_message("subscribed_target_topic", topic=topic))
 
@@ -1118,16 +1236,30 @@ class IoTRulesExplorer:
             print(get_message("instruction_4"))
             print(get_message("instruction_5"))
 
+            where = compile_where_condition(where_condition) if where_condition else None
+
+            # Prompts and outcome messages that do not change between test iterations
+            pattern_display = topic_pattern or get_message("no_specific_pattern")
+            pattern_line = f"\n{get_message('topic_pattern_display', pattern=pattern_display)}"
+            where_line = f"\n{get_message('where_condition_label', condition=where_condition)}"
+            topic_prompt = get_message("should_match_topic")
+            where_prompt = get_message("should_match_where")
+            message_display_line = f"\n{get_message('test_message_display')}"
+            should_trigger_line = f"\n{get_message('prediction_should_trigger')}"
+            should_not_trigger_line = f"\n{get_message('prediction_should_not_trigger')}"
+            publishing_line = f"\n{get_message('publishing_test_message')}"
+            waiting_text = get_message("waiting_rule_processing")
+            next_test_prompt = f"\n{get_message('press_enter_next_test')}"
+
             test_count = 0
             while True:
                 test_count += 1
-                print(f"\n{get_message('header_separator')}")
+                print(f"\n{HEADER_SEPARATOR}")
                 print(get_message("test_message_header", count=test_count))
-                print(f"{get_message('header_separator')}")
+                print(HEADER_SEPARATOR)
 
-                pattern_display = topic_pattern or get_message("no_specific_pattern")
-                print(f"\n{get_message('topic_pattern_display', pattern=pattern_display)}")
-                topic_should_match = input(get_message("should_match_topic")).strip().lower()
+                print(pattern_line)
+                topic_should_match = input(topic_prompt).strip().lower()
 
                 if topic_should_match == "quit":
                     break
@@ -1141,35 +1273,33 @@ class IoTRulesExplorer:
 
                 where_should_match = "y"
                 if where_condition:
-                    print(f"\n{get_message('where_condition_label', condition=where_condition)}")
-                    where_should_match = input(get_message("should_match_where")).strip().lower()
+                    print(where_line)
+                    where_should_match = input(where_prompt).strip().lower()
 
-                test_message = self.generate_test_message(where_condition, where_should_match == "y")
+                test_message = self.generate_test_message(where, where_should_match == "y")
 
-                print(f"\n{get_message('test_message_display')}")
+                print(message_display_line)
                 print(get_message("topic_label", topic=test_topic))
-                print(get_message("payload_label", payload=json.dumps(test_message, indent=2)))
+                # Serialize once; the same formatted JSON is displayed and published
+                payload_str = _dumps(test_message, indent=True)
+                print(get_message("payload_label", payload=payload_str))
 
                 should_trigger = (topic_should_match == "y") and (where_should_match == "y")
-                prediction_msg = (
-                    get_message("prediction_should_trigger")
-                    if should_trigger
-                    else get_message("prediction_should_not_trigger")
-                )
-                print(f"\n{prediction_msg}")
+                print(should_trigger_line if should_trigger else should_not_trigger_line)
 
-                print(f"\n{get_message('publishing_test_message')}")
+                print(publishing_line)
+                received_before = received_total
                 publish_future, _ = mqtt_connection.publish(
                     topic=test_topic,
-                    payload=json.dumps(test_message),
+                    payload=payload_str,
                     qos=mqtt.QoS.AT_LEAST_ONCE,
                 )
                 publish_future.result(timeout=10)
 
-                print(get_message("waiting_rule_processing"))
+                print(waiting_text)
                 time.sleep(3)
 
-                recent_count = len([msg for msg in messages_received[-3:]])
+                recent_count = received_total - received_before
 
                 if should_trigger and recent_count == 0:
                     print(get_message("expected_trigger_no_output"))
@@ -1180,7 +1310,7 @@ class IoTRulesExplorer:
                 else:
                     print(get_message("rule_correctly_not_triggered"))
 
-                input(f"\n{get_message('press_enter_next_test')}")
+                input(next_test_prompt)
 
         except Exception as e:
             print(get_message("testing_error", error=str(e)))
@@ -1190,77 +1320,52 @@ class IoTRulesExplorer:
             disconnect_future.result(timeout=10)
             print(get_message("disconnected_aws_iot"))
 
-    def generate_matching_topic(self, topic_pattern):
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def generate_matching_topic(topic_pattern):
         """Generate a topic that matches the pattern"""
         if not topic_pattern:
             return "testRulesEngineTopic/device123/temperature"
-        return topic_pattern.replace("+", "device123")
+        return topic_pattern.replace("+", "device123").replace("#", "any/subtopic")
 
-    def generate_non_matching_topic(self, topic_pattern):
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def generate_non_matching_topic(topic_pattern):
         """Generate a topic that doesn't match the pattern"""
         if not topic_pattern:
             return "different/topic/structure"
         return "nonmatching/topic/path"
 
-    def generate_test_message(self, where_condition, should_match):
-        """Generate test message based on WHERE condition"""
-        base_message = {
-            "deviceId": "test-device-123",
-            "timestamp": int(time.time() * 1000),
-        }
+    def generate_test_message(self, where, should_match):
+        """Generate test message based on a compiled WHERE condition"""
+        base_message = dict(self.TEST_MESSAGE_TEMPLATE, timestamp=int(time.time() * 1000))
 
-        if not where_condition:
+        if where is None:
             base_message.update({"temperature": 23.5, "humidity": 45.0, "status": "active"})
             return base_message
 
-        condition_lower = where_condition.lower()
-
-        if "temperature" in condition_lower:
-            if should_match:
-                if ">" in condition_lower:
-                    try:
-                        threshold = float(condition_lower.split(">")[1].strip())
-                        base_message["temperature"] = threshold + 5
-                    except (ValueError, IndexError):
-                        base_message["temperature"] = 30.0
-                elif "<" in condition_lower:
-                    try:
-                        threshold = float(condition_lower.split("<")[1].strip())
-                        base_message["temperature"] = threshold - 5
-                    except (ValueError, IndexError):
-                        base_message["temperature"] = 15.0
+        if where.field == "temperature":
+            if where.op == ">":
+                if where.threshold is not None:
+                    base_message["temperature"] = where.threshold + 5 if should_match else where.threshold - 5
                 else:
-                    base_message["temperature"] = 25.0
-            else:
-                if ">" in condition_lower:
-                    try:
-                        threshold = float(condition_lower.split(">")[1].strip())
-                        base_message["temperature"] = threshold - 5
-                    except (ValueError, IndexError):
-                        base_message["temperature"] = 20.0
-                elif "<" in condition_lower:
-                    try:
-                        threshold = float(condition_lower.split("<")[1].strip())
-                        base_message["temperature"] = threshold + 5
-                    except (ValueError, IndexError):
-                        base_message["temperature"] = 30.0
-
-        elif "humidity" in condition_lower:
-            base_message["humidity"] = 85.0 if should_match and ">" in condition_lower else 40.0
-
-        elif "status" in condition_lower:
-            if should_match:
-                if "'active'" in condition_lower or '"active"' in condition_lower:
-                    base_message["status"] = "active"
-                elif "'offline'" in condition_lower or '"offline"' in condition_lower:
-                    base_message["status"] = "offline"
+                    base_message["temperature"] = 30.0 if should_match else 20.0
+            elif where.op == "<":
+                if where.threshold is not None:
+                    base_message["temperature"] = where.threshold - 5 if should_match else where.threshold + 5
                 else:
-                    base_message["status"] = "active"
-            else:
-                base_message["status"] = "inactive"
+                    base_message["temperature"] = 15.0 if should_match else 30.0
+            elif should_match:
+                base_message["temperature"] = 25.0
+
+        elif where.field == "humidity":
+            base_message["humidity"] = 85.0 if should_match and where.op == ">" else 40.0
+
+        elif where.field == "status":
+            base_message["status"] = where.literal if should_match else "inactive"
 
-        elif "level" in condition_lower or "battery" in condition_lower:
-            base_message["level"] = 15 if should_match and "<" in condition_lower else 50
+        elif where.field == "level":
+            base_message["level"] = 15 if should_match and where.op == "<" else 50
 
         else:
             base_message.update(
@@ -1278,7 +1383,7 @@ def main():
         debug_mode = "--debug" in sys.argv or "-d" in sys.argv
 
         print(get_message("main_title"))
-        print(get_message("header_separator"))
+        print(HEADER_SEPARATOR)
 
         try:
             sts = boto3.client("sts")
@@ -1315,7 +1420,7 @@ def main():
         else:
             print(f"\n{get_message('debug_tip')}")
 
-        print(get_message("header_separator"))
+        print(HEADER_SEPARATOR)
 
         explorer = IoTRulesExplorer(debug=debug_mode)
 
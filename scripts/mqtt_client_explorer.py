@@ -8,11 +8,16 @@ Educational MQTT client for learning AWS IoT Core communication patterns.
 """
 import json
 import os
+import queue
+import re
 import sys
 import threading
 import time
 import uuid
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property, lru_cache
 
 # Add i18n to path
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "i18n"))
@@ -28,6 +33,14 @@ try:
 except ImportError:
     MQTT5_AVAILABLE = False
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from kv_parser import parse_kv
 from language_selector import get_language
 from loader import load_messages
 
@@ -36,31 +49,311 @@ USER_LANG = "en"
 messages = {}
 DEBUG_MODE = False
 
+# IoT data endpoints by region as (endpoint, time fetched); the endpoint rarely changes, so it is reused for a while
+ENDPOINT_CACHE = {}
+ENDPOINT_CACHE_TTL = 20 * 60
+
+# Short-lived cache of registry listings so reconnecting from the menu does not repeat them
+REGISTRY_CACHE = {}
+REGISTRY_CACHE_TTL = 30
+
+# Unacknowledged publishes allowed before the next one waits; this is what paces the batch publisher
+MAX_INFLIGHT_PUBLISHES = 20
+
+# Most queued messages the batch publisher sends before waiting on an acknowledgement
+PUBLISH_BATCH_SIZE = 64
+
+# Seconds the flush command waits for the batch publisher to catch up
+FLUSH_TIMEOUT = 30
+
+# Set to any value to round-trip a QoS 1 probe publish after connecting in debug mode
+CONNECTION_PROBE_ENV = "AWS_IOT_CONNECTION_PROBE"
+CONNECTION_PROBE_TIMEOUT = 2
+
+# Certificate principal ARNs, capturing the certificate ID
+CERT_ARN_PATTERN = re.compile(r":cert/([0-9a-f]+)$")
+
+# Payloads starting with an object or array are treated as JSON candidates
+JSON_START_PATTERN = re.compile(rb"\s*[{\[]")
+
+# Console separators
+HEADER_SEPARATOR = "=" * 60
+SECTION_SEPARATOR = "=" * 50
+MESSAGE_SEPARATOR = "=" * 70
+STEP_SEPARATOR = "-" * 50
+DETAILS_SEPARATOR = "-" * 40
+
+# Last (epoch second, "HH:MM:SS") pair formatted by format_clock
+CLOCK_CACHE = [(None, "")]
+
+# Message keys describing each QoS level, indexed by QoS
+QOS_MESSAGE_KEYS = ("qos_at_most_once", "qos_at_least_once", "qos_exactly_once")
+
+# AWS IoT Core supports QoS 0 and 1, so higher requests are sent as QoS 1
+QOS_LEVELS = (mqtt.QoS.AT_MOST_ONCE, mqtt.QoS.AT_LEAST_ONCE)
+
+# Sent and received messages kept per direction for the history command; older ones are dropped
+MESSAGE_HISTORY_LIMIT = 1000
+
+# Valid AWS IoT MQTT client IDs, length included
+CLIENT_ID_PATTERN = re.compile(r"[a-zA-Z0-9_-]{1,128}")
+
+
+@lru_cache(maxsize=None)
+def _msg_static(key):
+    """Resolve a message key once per loaded language; cleared when messages are reloaded"""
+    return messages.get(key, key)
+
 
 def get_message(key, *args):
     """Get localized message with optional formatting"""
-    msg = messages.get(key, key)
+    msg = _msg_static(key)
     if args:
         return msg.format(*args)
     return msg
 
 
-def display_aws_context():
+def unquote(text):
+    """Remove one pair of matching surrounding quotes from a command-line argument"""
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in "'\"":
+        return text[1:-1]
+    return text
+
+
+def _dumps(obj, indent=False):
+    """Serialize to a JSON string, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None, default=str)
+
+
+def _loads(data):
+    """Parse JSON from bytes or str, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def encode_payload(message):
+    """Encode a message as publish-ready bytes; returns (payload, content_type)"""
+    if isinstance(message, (bytes, bytearray, memoryview)):
+        return bytes(message), "application/octet-stream"
+    if isinstance(message, dict):
+        payload = orjson.dumps(message) if ORJSON_AVAILABLE else json.dumps(message).encode("utf-8")
+        return payload, "application/json"
+
+    payload = str(message).encode("utf-8")
+    # Auto-detect JSON content type
+    try:
+        _loads(payload)
+        return payload, "application/json"
+    except ValueError:
+        return payload, "text/plain"
+
+
+def format_clock(timestamp=None):
+    """Format an epoch timestamp (default: now) as HH:MM:SS.mmm, calling strftime at most once per second"""
+    total_ms = time.time_ns() // 1_000_000 if timestamp is None else int(timestamp * 1000)
+    secs, ms = divmod(total_ms, 1000)
+    cached_secs, hms = CLOCK_CACHE[0]
+    if cached_secs != secs:
+        hms = time.strftime("%H:%M:%S", time.localtime(secs))
+        CLOCK_CACHE[0] = (secs, hms)
+    return f"{hms}.{ms:03d}"
+
+
+def cached_registry_call(key, fetch):
+    """Return a cached registry result for key, calling fetch when missing or expired"""
+    cached = REGISTRY_CACHE.get(key)
+    if cached and time.monotonic() - cached[1] < REGISTRY_CACHE_TTL:
+        return cached[0]
+    result = fetch()
+    REGISTRY_CACHE[key] = (result, time.monotonic())
+    return result
+
+
+def display_aws_context(mqtt_client):
     """Display current AWS account and region information"""
     try:
-        sts = boto3.client("sts")
-        iot = boto3.client("iot")
-        identity = sts.get_caller_identity()
+        identity = mqtt_client.caller_identity
 
         print(f"\n{get_message('aws_context_info')}")
         print(f"   {get_message('account_id')}: {identity['Account']}")
-        print(f"   {get_message('region')}: {iot.meta.region_name}")
+        print(f"   {get_message('region')}: {mqtt_client.iot.meta.region_name}")
     except Exception as e:
         print(f"\n{get_message('aws_context_error')} {str(e)}")
         print(get_message("aws_credentials_reminder"))
     print()
 
 
+def command_quit(mqtt_client, parts, command_input):
+    """Leave interactive mode and reset the connection state"""
+    print(get_message("exiting_interactive"))
+    mqtt_client.cleanup_connection_state()
+    return True
+
+
+def command_help(mqtt_client, parts, command_input):
+    """Show the available interactive commands"""
+    print(f"\n{get_message('interactive_commands')}")
+    for cmd in get_message("command_list"):
+        print(cmd)
+
+
+def command_status(mqtt_client, parts, command_input):
+    """Show the connection status and active subscriptions"""
+    print(f"\n{get_message('connection_status')}")
+    if mqtt_client.connected:
+        print(get_message("connected_status"))
+    else:
+        print(get_message("disconnected_status"))
+
+    print(f"\n{get_message('active_subscriptions')}")
+    if mqtt_client.subscriptions:
+        for topic, info in mqtt_client.subscriptions.items():
+            print(f"   • {topic} (QoS {info.qos})")
+    else:
+        print(get_message("no_subscriptions"))
+
+
+def command_messages(mqtt_client, parts, command_input):
+    """Show the most recent received messages"""
+    print(f"\n{get_message('message_history')}")
+    if mqtt_client.received_messages:
+        for i, msg in enumerate(list(mqtt_client.received_messages)[-10:], 1):
+            received_at = msg.get("Timestamp")
+            timestamp = datetime.fromtimestamp(received_at).isoformat() if received_at else "Unknown"
+            topic = msg.get("Topic", "Unknown")
+            payload = str(msg.get("Payload", ""))[:100]
+            print(f"   {i}. [{timestamp}] {topic}: {payload}...")
+    else:
+        print(get_message("no_messages_received"))
+
+
+def command_debug(mqtt_client, parts, command_input):
+    """Show connection diagnostics"""
+    print(f"\n{get_message('connection_diagnostics')}")
+    print(f"   {get_message('endpoint_label')}: {mqtt_client.endpoint or get_message('not_set')}")
+    print(f"   {get_message('thing_name_label')}: {mqtt_client.thing_name or get_message('not_set')}")
+    print(f"   {get_message('connected_label')}: {mqtt_client.connected}")
+    print(f"   {get_message('subscriptions_label')}: {len(mqtt_client.subscriptions)}")
+    print(f"   {get_message('messages_received_label')}: {mqtt_client.message_count}")
+
+
+def command_verbose(mqtt_client, parts, command_input):
+    """Switch between full and one-line received message display"""
+    if len(parts) < 2 or parts[1].lower() not in ("on", "off"):
+        print("Usage: verbose on|off")
+        return
+    mqtt_client.verbose = parts[1].lower() == "on"
+    print(get_message("verbose_enabled" if mqtt_client.verbose else "verbose_disabled"))
+
+
+def command_batch(mqtt_client, parts, command_input):
+    """Switch batch publishing for pub, pub1 and json on or off"""
+    if len(parts) < 2 or parts[1].lower() not in ("on", "off"):
+        print("Usage: batch on|off")
+        return
+    mqtt_client.batch_mode = parts[1].lower() == "on"
+    print(get_message("batch_enabled" if mqtt_client.batch_mode else "batch_disabled"))
+
+
+def command_sub(mqtt_client, parts, command_input):
+    """Subscribe to a topic with QoS 0"""
+    if len(parts) < 2:
+        print("Usage: sub <topic>")
+        return
+    topic = parts[1]
+    mqtt_client.subscribe_to_topic(topic, 0, DEBUG_MODE)
+
+
+def command_sub1(mqtt_client, parts, command_input):
+    """Subscribe to a topic with QoS 1"""
+    if len(parts) < 2:
+        print("Usage: sub1 <topic>")
+        return
+    topic = parts[1]
+    mqtt_client.subscribe_to_topic(topic, 1, DEBUG_MODE)
+
+
+def command_unsub(mqtt_client, parts, command_input):
+    """Unsubscribe from a topic"""
+    if len(parts) < 2:
+        print("Usage: unsub <topic>")
+        return
+    mqtt_client.unsubscribe_from_topic(parts[1], DEBUG_MODE)
+
+
+def command_pub(mqtt_client, parts, command_input):
+    """Publish a text message with QoS 0"""
+    if len(parts) < 3:
+        print("Usage: pub <topic> <message>")
+        return
+    topic = parts[1]
+    message = unquote(command_input.split(None, 2)[2])
+    mqtt_client.submit_publish(topic, message, 0)
+
+
+def command_pub1(mqtt_client, parts, command_input):
+    """Publish a text message with QoS 1"""
+    if len(parts) < 3:
+        print("Usage: pub1 <topic> <message>")
+        return
+    topic = parts[1]
+    message = unquote(command_input.split(None, 2)[2])
+    mqtt_client.submit_publish(topic, message, 1)
+
+
+def command_json(mqtt_client, parts, command_input):
+    """Publish key=value pairs as a JSON object with QoS 0"""
+    if len(parts) < 3:
+        print("Usage: json <topic> key=val key2=val2...")
+        return
+    topic = parts[1]
+    json_data = parse_kv(command_input.split(None, 2)[2])
+    mqtt_client.submit_publish(topic, json_data, 0)
+
+
+def command_test(mqtt_client, parts, command_input):
+    """Publish a test message"""
+    test_topic = f"test/{getattr(mqtt_client, 'thing_name', 'device')}/message"
+    test_message = {
+        "timestamp": time.time(),
+        "message": "Hello from MQTT Client Explorer!",
+        "device": getattr(mqtt_client, "thing_name", "unknown"),
+    }
+    mqtt_client.publish_message(test_topic, test_message, 0)
+
+
+def command_flush(mqtt_client, parts, command_input):
+    """Wait for batch-queued messages to be published"""
+    if mqtt_client.flush_publishes():
+        print(get_message("publishes_flushed"))
+    else:
+        print(get_message("flush_timeout").format(FLUSH_TIMEOUT))
+
+
+# Interactive commands; a handler returns True to leave interactive mode
+COMMAND_HANDLERS = {
+    "quit": command_quit,
+    "exit": command_quit,
+    "help": command_help,
+    "status": command_status,
+    "messages": command_messages,
+    "debug": command_debug,
+    "verbose": command_verbose,
+    "batch": command_batch,
+    "flush": command_flush,
+    "sub": command_sub,
+    "sub1": command_sub1,
+    "unsub": command_unsub,
+    "pub": command_pub,
+    "pub1": command_pub1,
+    "json": command_json,
+    "test": command_test,
+}
+
+
 def interactive_messaging(mqtt_client):
     """Interactive command-line interface for MQTT operations"""
     if not mqtt_client.connected:
@@ -68,7 +361,7 @@ def interactive_messaging(mqtt_client):
         return
 
     print(f"\n{get_message('step_interactive_messaging')}")
-    print("=" * 50)
+    print(SECTION_SEPARATOR)
 
     # Show available commands
     print(f"\n{get_message('interactive_commands')}")
@@ -79,7 +372,7 @@ def interactive_messaging(mqtt_client):
     for guideline in get_message("topic_guidelines"):
         print(guideline)
 
-    print("\n" + "=" * 50)
+    print("\n" + SECTION_SEPARATOR)
 
     while True:
         try:
@@ -91,125 +384,11 @@ def interactive_messaging(mqtt_client):
             parts = command_input.split()
             command = parts[0].lower()
 
-            if command in ["quit", "exit"]:
-                print(get_message("exiting_interactive"))
-                mqtt_client.cleanup_connection_state()
-                break
-
-            elif command == "help":
-                print(f"\n{get_message('interactive_commands')}")
-                for cmd in get_message("command_list"):
-                    print(cmd)
-
-            elif command == "status":
-                print(f"\n{get_message('connection_status')}")
-                if mqtt_client.connected:
-                    print(get_message("connected_status"))
-                else:
-                    print(get_message("disconnected_status"))
-
-                print(f"\n{get_message('active_subscriptions')}")
-                if mqtt_client.subscriptions:
-                    for topic, info in mqtt_client.subscriptions.items():
-                        print(f"   • {topic} (QoS {info['qos']})")
-                else:
-                    print(get_message("no_subscriptions"))
-
-            elif command == "messages":
-                print(f"\n{get_message('message_history')}")
-                if mqtt_client.received_messages:
-                    for i, msg in enumerate(mqtt_client.received_messages[-10:], 1):
-                        timestamp = msg.get("Timestamp", "Unknown")
-                        topic = msg.get("Topic", "Unknown")
-                        payload = str(msg.get("Payload", ""))[:100]
-                        print(f"   {i}. [{timestamp}] {topic}: {payload}...")
-                else:
-                    print(get_message("no_messages_received"))
-
-            elif command == "debug":
-                print(f"\n{get_message('connection_diagnostics')}")
-                print(f"   {get_message('endpoint_label')}: {mqtt_client.endpoint or get_message('not_set')}")
-                print(f"   {get_message('thing_name_label')}: {mqtt_client.thing_name or get_message('not_set')}")
-                print(f"   {get_message('connected_label')}: {mqtt_client.connected}")
-                print(f"   {get_message('subscriptions_label')}: {len(mqtt_client.subscriptions)}")
-                print(f"   {get_message('messages_received_label')}: {len(mqtt_client.received_messages)}")
-
-            elif command == "sub":
-                if len(parts) < 2:
-                    print("Usage: sub <topic>")
-                    continue
-                topic = parts[1]
-                mqtt_client.subscribe_to_topic(topic, 0, DEBUG_MODE)
-
-            elif command == "sub1":
-                if len(parts) < 2:
-                    print("Usage: sub1 <topic>")
-                    continue
-                topic = parts[1]
-                mqtt_client.subscribe_to_topic(topic, 1, DEBUG_MODE)
-
-            elif command == "unsub":
-                if len(parts) < 2:
-                    print("Usage: unsub <topic>")
-                    continue
-                topic = parts[1]
-                if hasattr(mqtt_client, "unsubscribe_from_topic"):
-                    mqtt_client.unsubscribe_from_topic(topic, DEBUG_MODE)
-                else:
-                    print("Unsubscribe functionality not implemented yet")
-
-            elif command == "pub":
-                if len(parts) < 3:
-                    print("Usage: pub <topic> <message>")
-                    continue
-                topic = parts[1]
-                message = "".join(parts[2:]).strip("'\"")
-                mqtt_client.publish_message(topic, message, 0)
-
-            elif command == "pub1":
-                if len(parts) < 3:
-                    print("Usage: pub1 <topic> <message>")
-                    continue
-                topic = parts[1]
-                message = "".join(parts[2:]).strip("'\"")
-                mqtt_client.publish_message(topic, message, 1)
-
-            elif command == "json":
-                if len(parts) < 3:
-                    print("Usage: json <topic> key=val key2=val2...")
-                    continue
-                topic = parts[1]
-                # Parse key=value pairs into JSON
-                json_data = {}
-                for pair in parts[2:]:
-                    if "=" in pair:
-                        key, value = pair.split("=", 1)
-                        # Try to parse as number or boolean
-                        if value.lower() == "true":
-                            json_data[key] = True
-                        elif value.lower() == "false":
-                            json_data[key] = False
-                        elif value.isdigit():
-                            json_data[key] = int(value)
-                        else:
-                            try:
-                                json_data[key] = float(value)
-                            except ValueError:
-                                json_data[key] = value
-                mqtt_client.publish_message(topic, json_data, 0)
-
-            elif command == "test":
-                # Send a test message
-                test_topic = f"test/{getattr(mqtt_client, 'thing_name', 'device')}/message"
-                test_message = {
-                    "timestamp": time.time(),
-                    "message": "Hello from MQTT Client Explorer!",
-                    "device": getattr(mqtt_client, "thing_name", "unknown"),
-                }
-                mqtt_client.publish_message(test_topic, test_message, 0)
-
-            else:
+            handler = COMMAND_HANDLERS.get(command)
+            if handler is None:
                 print(get_message("invalid_command"))
+            elif handler(mqtt_client, parts, command_input):
+                break
 
         except KeyboardInterrupt:
             print(f"\n{get_message('exiting_interactive')}")
@@ -223,25 +402,69 @@ def interactive_messaging(mqtt_client):
                 traceback.print_exc()
 
 
+@dataclass(slots=True, frozen=True)
+class SubInfo:
+    """Bookkeeping for one active subscription"""
+
+    qos: int
+    granted_qos: int
+    packet_id: int
+    subscribed_at: str
+
+
 class MQTTClientExplorer:
     def __init__(self):
         self.connection = None
         self.connected = False
-        self.received_messages = []
-        self.sent_messages = []
+        self.received_messages = deque(maxlen=MESSAGE_HISTORY_LIMIT)
+        self.sent_messages = deque(maxlen=MESSAGE_HISTORY_LIMIT)
         self.subscriptions = {}
         self.message_lock = threading.Lock()
         self.message_count = 0
         self.endpoint = None
         self.thing_name = None
+        self.session = boto3.Session()
+        # Full metadata block per received message; when off, one line per message
+        self.verbose = True
+        self.debug_mode = False
+        self.inflight_publishes = threading.BoundedSemaphore(MAX_INFLIGHT_PUBLISHES)
+
+        # Received messages are formatted on a background thread so the CRT callback returns immediately
+        self.rx_queue = queue.SimpleQueue()
+        self.rx_thread = threading.Thread(target=self.rx_printer_loop, daemon=True)
+        self.rx_thread.start()
+
+        # Batch mode hands pub/pub1/json messages to a background publisher instead of waiting on each one
+        self.batch_mode = False
+        self.publish_queue = queue.SimpleQueue()
+        self.publish_thread = threading.Thread(target=self.publish_worker_loop, daemon=True)
+        self.publish_thread.start()
+
+    @cached_property
+    def iot(self):
+        """IoT control plane client, created on first use and shared by all lookups"""
+        return self.session.client("iot")
+
+    @cached_property
+    def sts(self):
+        """STS client, created on first use"""
+        return self.session.client("sts")
+
+    @cached_property
+    def caller_identity(self):
+        """STS caller identity, fetched once; failed lookups are not cached and are retried on next use"""
+        return self.sts.get_caller_identity()
 
     def cleanup_connection_state(self):
         """Clean up connection state when disconnecting or reconnecting"""
         self.connected = False
-        self.received_messages = []
-        self.sent_messages = []
+        self.discard_received_messages()
+        with self.message_lock:
+            self.received_messages = deque(maxlen=MESSAGE_HISTORY_LIMIT)
+            self.sent_messages = deque(maxlen=MESSAGE_HISTORY_LIMIT)
+            self.message_count = 0
         self.subscriptions = {}
-        self.message_count = 0
+        self.discard_queued_publishes()
         if self.connection:
             try:
                 self.connection.disconnect()
@@ -249,46 +472,52 @@ class MQTTClientExplorer:
                 pass
         self.connection = None
 
+    def discard_received_messages(self):
+        """Drop received messages the printer thread has not shown yet"""
+        while True:
+            try:
+                self.rx_queue.get_nowait()
+            except queue.Empty:
+                break
+
+    def discard_queued_publishes(self):
+        """Drop messages still waiting for the batch publisher, releasing anyone blocked on a flush"""
+        while True:
+            try:
+                item = self.publish_queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, threading.Event):
+                item.set()
+
     def print_header(self, title):
         """Print formatted header"""
         print(f"\n📡 {title}")
-        print("=" * 60)
+        print(HEADER_SEPARATOR)
 
     def print_step(self, step, description):
         """Print step with formatting"""
         print(f"\n🔧 Step {step}: {description}")
-        print("-" * 50)
+        print(STEP_SEPARATOR)
 
     def print_mqtt_details(self, message_type, details):
         """Print detailed MQTT protocol information"""
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        print(f"\n📊 MQTT {message_type} Details [{timestamp}]")
-        print("-" * 40)
+        timestamp = format_clock()
+        lines = ["", f"📊 MQTT {message_type} Details [{timestamp}]", DETAILS_SEPARATOR]
 
         for key, value in details.items():
             if isinstance(value, dict):
-                print(f"   {key}:")
-                for sub_key, sub_value in value.items():
-                    print(f"      {sub_key}: {sub_value}")
+                lines.append(f"   {key}:")
+                lines.extend(f"      {sub_key}: {sub_value}" for sub_key, sub_value in value.items())
             else:
-                print(f"   {key}: {value}")
+                lines.append(f"   {key}: {value}")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def validate_client_id(self, client_id):
         """Validate MQTT Client ID according to AWS IoT requirements"""
-        if not client_id:
-            return False
-
-        # Length check: 1-128 characters
-        if len(client_id) < 1 or len(client_id) > 128:
-            return False
-
-        # Character check: alphanumeric, hyphens, and underscores only
-        import re
-
-        if not re.match(r"^[a-zA-Z0-9_-]+$", client_id):
-            return False
-
-        return True
+        # 1-128 characters: alphanumeric, hyphens, and underscores only
+        return bool(client_id) and CLIENT_ID_PATTERN.fullmatch(client_id) is not None
 
     def get_client_id(self, thing_name):
         """Get client ID from user input or generate automatically"""
@@ -343,17 +572,23 @@ class MQTTClientExplorer:
     def get_iot_endpoint(self, debug=False):
         """Get AWS IoT endpoint for the account"""
         try:
-            iot = boto3.client("iot")
+            iot = self.iot
+            region = iot.meta.region_name
 
-            if debug:
-                print(get_message("debug_calling_api"))
-                print(f"{get_message('debug_input_params')} {{'endpointType': 'iot:Data-ATS'}}")
+            cached = ENDPOINT_CACHE.get(region)
+            if cached and time.monotonic() - cached[1] < ENDPOINT_CACHE_TTL:
+                endpoint = cached[0]
+            else:
+                if debug:
+                    print(get_message("debug_calling_api"))
+                    print(f"{get_message('debug_input_params')} {{'endpointType': 'iot:Data-ATS'}}")
 
-            response = iot.describe_endpoint(endpointType="iot:Data-ATS")
-            endpoint = response["endpointAddress"]
+                response = iot.describe_endpoint(endpointType="iot:Data-ATS")
+                endpoint = response["endpointAddress"]
+                ENDPOINT_CACHE[region] = (endpoint, time.monotonic())
 
-            if debug:
-                print(f"{get_message('debug_api_response')} {json.dumps(response, indent=2, default=str)}")
+                if debug:
+                    print(f"{get_message('debug_api_response')} {json.dumps(response, indent=2, default=str)}")
 
             print(get_message("iot_endpoint_discovery"))
             print(f"   {get_message('endpoint_type_label')}: {get_message('endpoint_type_recommended')}")
@@ -373,15 +608,18 @@ class MQTTClientExplorer:
     def select_device_and_certificate(self, debug=False):
         """Select a device and its certificate for MQTT connection"""
         try:
-            iot = boto3.client("iot")
+            iot = self.iot
 
             # Get all Things
             if debug:
                 print(get_message("debug_calling_list_things"))
                 print(get_message("debug_input_params_none"))
 
-            things_response = iot.list_things()
-            things = things_response.get("things", [])
+            region = iot.meta.region_name
+            things = cached_registry_call(
+                ("things", region),
+                lambda: [thing for page in iot.get_paginator("list_things").paginate() for thing in page.get("things", [])],
+            )
 
             if debug:
                 print(get_message("debug_api_response_found_things").format(len(things)))
@@ -416,9 +654,21 @@ class MQTTClientExplorer:
                 print(get_message("debug_calling_list_principals"))
                 print(f"{get_message('debug_input_params_thing')} {{'thingName': '{selected_thing}'}}")
 
-            principals_response = iot.list_thing_principals(thingName=selected_thing)
-            principals = principals_response.get("principals", [])
-            cert_arns = [p for p in principals if "cert/" in p]
+            principals = cached_registry_call(
+                ("principals", region, selected_thing),
+                lambda: [
+                    principal
+                    for page in iot.get_paginator("list_thing_principals").paginate(thingName=selected_thing)
+                    for principal in page.get("principals", [])
+                ],
+            )
+            cert_arns = []
+            cert_ids = []
+            for principal in principals:
+                cert_match = CERT_ARN_PATTERN.search(principal)
+                if cert_match:
+                    cert_arns.append(principal)
+                    cert_ids.append(cert_match.group(1))
 
             if debug:
                 print(get_message("debug_api_response_principals").format(len(principals), len(cert_arns)))
@@ -431,21 +681,18 @@ class MQTTClientExplorer:
 
             # Select certificate if multiple
             if len(cert_arns) == 1:
-                selected_cert_arn = cert_arns[0]
-                cert_id = selected_cert_arn.split("/")[-1]
+                cert_id = cert_ids[0]
                 print(f"{get_message('using_certificate')} {cert_id}")
             else:
                 print(f"\n{get_message('multiple_certificates_found')}")
-                for i, cert_arn in enumerate(cert_arns, 1):
-                    cert_id = cert_arn.split("/")[-1]
+                for i, cert_id in enumerate(cert_ids, 1):
                     print(f"   {i}. {cert_id}")
 
                 while True:
                     try:
                         choice = int(input(get_message("select_certificate").format(len(cert_arns)))) - 1
                         if 0 <= choice < len(cert_arns):
-                            selected_cert_arn = cert_arns[choice]
-                            cert_id = selected_cert_arn.split("/")[-1]
+                            cert_id = cert_ids[choice]
                             break
                         else:
                             print(get_message("invalid_selection"))
@@ -465,12 +712,17 @@ class MQTTClientExplorer:
             cert_file = None
             key_file = None
 
-            for file in os.listdir(cert_dir):
-                if cert_id in file:
-                    if file.endswith(".crt"):
-                        cert_file = os.path.join(cert_dir, file)
-                    elif file.endswith(".key"):
-                        key_file = os.path.join(cert_dir, file)
+            with os.scandir(cert_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if cert_id not in name:
+                        continue
+                    if name.endswith(".crt"):
+                        cert_file = entry.path
+                    elif name.endswith(".key"):
+                        key_file = entry.path
+                    if cert_file and key_file:
+                        break
 
             if not cert_file or not key_file:
                 print(get_message("cert_files_not_found").format(cert_dir))
@@ -515,14 +767,23 @@ class MQTTClientExplorer:
         # Re-subscribe to all topics if session not present
         if not session_present and self.subscriptions:
             print(get_message("resubscribing_topics").format(len(self.subscriptions)))
-            topics_to_resubscribe = list(self.subscriptions.items())
-            for topic, info in topics_to_resubscribe:
+            # Send every SUBSCRIBE first so all topics are restored in about one round trip;
+            # iterate a key snapshot because failed topics are removed from the dict
+            pending = []
+            for topic in tuple(self.subscriptions):
+                qos = self.subscriptions[topic].qos
                 try:
-                    qos = info["qos"] if isinstance(info, dict) else info
-                    mqtt_qos = mqtt.QoS.AT_MOST_ONCE if qos == 0 else mqtt.QoS.AT_LEAST_ONCE
                     subscribe_future, _ = self.connection.subscribe(
-                        topic=topic, qos=mqtt_qos, callback=self.on_message_received
+                        topic=topic, qos=QOS_LEVELS[min(qos, 1)], callback=self.on_message_received
                     )
+                    pending.append((topic, qos, subscribe_future))
+                except Exception as e:
+                    print(f"{get_message('failed_resubscribe').format(topic)} {str(e)}")
+                    # Remove failed subscription from tracking
+                    self.subscriptions.pop(topic, None)
+
+            for topic, qos, subscribe_future in pending:
+                try:
                     subscribe_future.result()
                     print(get_message("resubscribed_to_topic").format(topic, qos))
                 except Exception as e:
@@ -531,24 +792,52 @@ class MQTTClientExplorer:
                     self.subscriptions.pop(topic, None)
 
     def on_message_received(self, topic, payload, dup, qos, retain, **kwargs):
-        """Callback for received messages with comprehensive MQTT metadata"""
+        """Callback for received messages; only queues the raw message for the printer thread"""
+        self.rx_queue.put((topic, bytes(payload), dup, qos, retain, kwargs, time.time()))
+
+    def rx_printer_loop(self):
+        """Print queued received messages in arrival order"""
+        while True:
+            self.print_received_message(*self.rx_queue.get())
+
+    def print_received_message(self, topic, payload, dup, qos, retain, properties, received_at):
+        """Record and print a received message with comprehensive MQTT metadata"""
+        if not self.verbose:
+            # Compact mode skips payload parsing and the metadata block
+            with self.message_lock:
+                self.received_messages.append(
+                    {
+                        "Topic": topic,
+                        "Timestamp": received_at,
+                        "Payload": payload.decode("utf-8", "replace"),
+                    }
+                )
+                self.message_count += 1
+                count = self.message_count
+            notice = get_message("incoming_message").format(count, format_clock(received_at))
+            sys.stdout.write(f"\n{notice} {topic} ({len(payload)} bytes)\n{get_message('mqtt_prompt')}")
+            sys.stdout.flush()
+            return
+
         try:
-            # Try to parse as JSON, fallback to string
-            try:
-                message_data = json.loads(payload.decode("utf-8"))
-                payload_display = json.dumps(message_data, indent=2)
-                is_json = True
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                payload_display = payload.decode("utf-8")
-                is_json = False
-
-            # Extract additional MQTT properties from kwargs
-            user_properties = kwargs.get("user_properties", [])
-            content_type = kwargs.get("content_type", None)
-            correlation_data = kwargs.get("correlation_data", None)
-            message_expiry_interval = kwargs.get("message_expiry_interval", None)
-            response_topic = kwargs.get("response_topic", None)
-            payload_format_indicator = kwargs.get("payload_format_indicator", None)
+            # Only payloads that look like a JSON object or array are parsed; anything else is shown as text
+            is_json = JSON_START_PATTERN.match(payload) is not None
+            if is_json:
+                try:
+                    payload_display = _dumps(_loads(payload), indent=True)
+                except ValueError:
+                    is_json = False
+            if not is_json:
+                payload_display = payload.decode("utf-8", "replace")
+
+            # Extract additional MQTT properties
+            user_properties = properties.get("user_properties", [])
+            content_type = properties.get("content_type", None)
+            correlation_data = properties.get("correlation_data", None)
+            message_expiry_interval = properties.get("message_expiry_interval", None)
+            response_topic = properties.get("response_topic", None)
+            payload_format_indicator = properties.get("payload_format_indicator", None)
+            payload_size = f"{len(payload)} bytes"
 
             message_info = {
                 "Direction": "RECEIVED",
@@ -556,8 +845,8 @@ class MQTTClientExplorer:
                 "QoS": qos,
                 "Duplicate": dup,
                 "Retain": retain,
-                "Payload Size": f"{len(payload)} bytes",
-                "Timestamp": datetime.now().isoformat(),
+                "Payload Size": payload_size,
+                "Timestamp": received_at,
                 "Payload": payload_display,
                 "User Properties": user_properties,
                 "Content Type": content_type,
@@ -567,27 +856,22 @@ class MQTTClientExplorer:
                 "Payload Format": payload_format_indicator,
             }
 
+            # Locked because cleanup_connection_state replaces the history and resets the count from the main thread
             with self.message_lock:
                 self.received_messages.append(message_info)
                 self.message_count += 1
+                count = self.message_count
 
-            # Immediate visual notification with enhanced formatting
-            timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-            print("\n" + "=" * 70)
-            print(get_message("incoming_message").format(self.message_count, timestamp))
-            print("=" * 70)
+            # Immediate visual notification with enhanced formatting, written as one block
+            timestamp = format_clock(received_at)
+            header = get_message("incoming_message").format(count, timestamp)
+            lines = ["", MESSAGE_SEPARATOR, header, MESSAGE_SEPARATOR]
 
             # Core MQTT Properties
-            print(f"{get_message('topic_label')} {topic}")
-            qos_desc = (
-                get_message("qos_at_most_once")
-                if qos == 0
-                else get_message("qos_at_least_once")
-                if qos == 1
-                else get_message("qos_exactly_once")
-            )
-            print(f"{get_message('qos_label')} {qos} ({qos_desc})")
-            print(f"{get_message('payload_size_label')} {len(payload)} bytes")
+            lines.append(f"{get_message('topic_label')} {topic}")
+            qos_desc = get_message(QOS_MESSAGE_KEYS[qos])
+            lines.append(f"{get_message('qos_label')} {qos} ({qos_desc})")
+            lines.append(f"{get_message('payload_size_label')} {payload_size}")
 
             # MQTT Flags
             flags = []
@@ -596,7 +880,7 @@ class MQTTClientExplorer:
             if retain:
                 flags.append(get_message("retain_flag"))
             if flags:
-                print(f"{get_message('flags_label')} {', '.join(flags)}")
+                lines.append(f"{get_message('flags_label')} {', '.join(flags)}")
 
             # MQTT5 Properties (if available)
             mqtt5_props = []
@@ -619,21 +903,21 @@ class MQTTClientExplorer:
                     mqtt5_props.append(f"   • {prop[0]}: {prop[1]}")
 
             if mqtt5_props:
-                print(get_message("mqtt5_properties"))
-                for prop in mqtt5_props:
-                    print(f"   {prop}")
+                lines.append(get_message("mqtt5_properties"))
+                lines.extend(f"   {prop}" for prop in mqtt5_props)
 
             # Payload Display
-            print(get_message("message_payload"))
+            lines.append(get_message("message_payload"))
             if is_json:
-                print(get_message("json_format"))
-                for line in payload_display.split("\n"):
-                    print(f"   {line}")
+                lines.append(get_message("json_format"))
+                lines.append("   " + payload_display.replace("\n", "\n   "))
             else:
-                print(f"{get_message('text_format')} {payload_display}")
+                lines.append(f"{get_message('text_format')} {payload_display}")
 
-            print("=" * 70)
-            print(get_message("mqtt_prompt"), end="", flush=True)  # Restore prompt
+            lines.append(MESSAGE_SEPARATOR)
+            lines.append(get_message("mqtt_prompt"))  # Restore prompt
+            sys.stdout.write("\n".join(lines))
+            sys.stdout.flush()
 
         except Exception as e:
             print(f"\n{get_message('error_processing_message')} {str(e)}")
@@ -733,14 +1017,15 @@ class MQTTClientExplorer:
                 },
             )
 
-            # Test basic connectivity with a simple operation
-            if debug:
+            # The resolved connect future already means CONNACK was received; a round-trip probe is opt-in
+            if debug and os.getenv(CONNECTION_PROBE_ENV):
                 print(get_message("testing_connection_stability"))
                 try:
-                    # Try a simple operation to verify the connection is fully functional
-                    import time
-
-                    time.sleep(1)
+                    # A QoS 1 publish is acknowledged by the broker, proving the connection carries traffic
+                    probe_future, _ = self.connection.publish(
+                        topic=f"test/{thing_name}/probe", payload=b"", qos=mqtt.QoS.AT_LEAST_ONCE
+                    )
+                    probe_future.result(timeout=CONNECTION_PROBE_TIMEOUT)
                     print(get_message("connection_stable"))
                 except Exception as test_e:
                     print(f"{get_message('connection_unstable')} {str(test_e)}")
@@ -760,7 +1045,7 @@ class MQTTClientExplorer:
         try:
             print(f"\n{get_message('subscribing_to_topic')}")
             print(f"   Topic: {topic}")
-            qos_desc = get_message("qos_at_most_once") if qos == 0 else get_message("qos_at_least_once")
+            qos_desc = get_message(QOS_MESSAGE_KEYS[qos])
             print(f"   QoS: {qos} ({qos_desc})")
 
             if debug:
@@ -771,7 +1056,7 @@ class MQTTClientExplorer:
                 print(f"{get_message('requested_qos_debug')} {qos}")
 
             # Convert QoS to proper enum
-            mqtt_qos = mqtt.QoS.AT_MOST_ONCE if qos == 0 else mqtt.QoS.AT_LEAST_ONCE
+            mqtt_qos = QOS_LEVELS[min(qos, 1)]
 
             if debug:
                 print(f"{get_message('converted_qos_debug')} {mqtt_qos}")
@@ -800,12 +1085,7 @@ class MQTTClientExplorer:
             elif isinstance(subscribe_result, dict) and "qos" in subscribe_result:
                 granted_qos = subscribe_result["qos"]
 
-            self.subscriptions[topic] = {
-                "qos": qos,
-                "granted_qos": granted_qos,
-                "packet_id": packet_id,
-                "subscribed_at": datetime.now().isoformat(),
-            }
+            self.subscriptions[topic] = SubInfo(qos, granted_qos, packet_id, datetime.now().isoformat())
 
             self.print_mqtt_details(
                 get_message("subscription_established"),
@@ -858,43 +1138,79 @@ class MQTTClientExplorer:
 
             return False
 
-    def publish_message(self, topic, message, qos=0, **mqtt_properties):
-        """Publish a message to an MQTT topic with optional MQTT5 properties"""
+    def unsubscribe_from_topic(self, topic, debug=False):
+        """Unsubscribe from an MQTT topic and stop tracking it"""
         if not self.connected:
             print(get_message("not_connected_iot"))
             return False
 
+        if topic not in self.subscriptions:
+            print(get_message("not_subscribed_to_topic").format(topic))
+            return False
+
         try:
-            # Prepare payload
-            if isinstance(message, dict):
-                payload = json.dumps(message)
-                content_type = "application/json"
-            else:
-                payload = str(message)
-                # Auto-detect JSON content type
-                try:
-                    json.loads(payload)
-                    content_type = "application/json"
-                except (json.JSONDecodeError, ValueError):
-                    content_type = "text/plain"
+            print(f"\n{get_message('unsubscribing_from_topic')}")
+            print(f"   Topic: {topic}")
+
+            unsubscribe_future, packet_id = self.connection.unsubscribe(topic)
+            unsubscribe_result = unsubscribe_future.result()
+
+            if debug:
+                print(f"{get_message('packet_id_debug')} {packet_id}")
+                print(f"{get_message('result_debug')} {unsubscribe_result}")
+
+            self.subscriptions.pop(topic, None)
+
+            self.print_mqtt_details(
+                get_message("unsubscription_complete"),
+                {
+                    "Topic": topic,
+                    get_message("packet_id_label"): packet_id,
+                    get_message("status_label"): get_message("status_unsubscribed"),
+                },
+            )
+            return True
+
+        except Exception as e:
+            print(f"{get_message('unsubscribe_failed')} {str(e)}")
+            return False
+
+    def publish_message(self, topic, message, qos=0, **mqtt_properties):
+        """Publish a message to an MQTT topic and wait until the publish completes"""
+        completed = threading.Event()
+        publish_future, _ = self.publish_message_async(
+            topic, message, qos, on_complete=lambda future: completed.set(), **mqtt_properties
+        )
+        if publish_future is None:
+            return False
+
+        # Wait for the completion callback so the confirmation is printed before the prompt returns
+        completed.wait()
+        return publish_future.exception() is None
+
+    def publish_message_async(self, topic, message, qos=0, on_complete=None, **mqtt_properties):
+        """Publish a message with optional MQTT5 properties without waiting; returns (future, packet_id)"""
+        if not self.connected:
+            print(get_message("not_connected_iot"))
+            return None, None
+
+        payload = b""
+        acquired = False
+        try:
+            payload, content_type = encode_payload(message)
 
             # Extract MQTT5 properties
             user_properties = mqtt_properties.get("user_properties", [])
             correlation_data = mqtt_properties.get("correlation_data", None)
             message_expiry_interval = mqtt_properties.get("message_expiry_interval", None)
             response_topic = mqtt_properties.get("response_topic", None)
+            payload_size = f"{len(payload)} bytes"
 
             print(f"\n{get_message('publishing_message')}")
             print(f"   Topic: {topic}")
-            qos_desc = (
-                get_message("qos_at_most_once")
-                if qos == 0
-                else get_message("qos_at_least_once")
-                if qos == 1
-                else get_message("qos_exactly_once")
-            )
+            qos_desc = get_message(QOS_MESSAGE_KEYS[qos])
             print(f"   QoS: {qos} ({qos_desc})")
-            print(f"   Payload Size: {len(payload)} bytes")
+            print(f"   Payload Size: {payload_size}")
             print(f"   {get_message('content_type_label')}: {content_type}")
 
             # Show MQTT5 properties if any
@@ -911,36 +1227,27 @@ class MQTTClientExplorer:
                     for prop in user_properties:
                         print(f"         • {prop[0]}: {prop[1]}")
 
-            # Prepare publish parameters
-            publish_params = {"topic": topic, "payload": payload, "qos": qos}
-
-            # Prepare publish parameters
-            publish_params = {"topic": topic, "payload": payload, "qos": qos}
-
-            # Convert QoS to proper enum
-            mqtt_qos = mqtt.QoS.AT_MOST_ONCE if qos == 0 else mqtt.QoS.AT_LEAST_ONCE
-            publish_params["qos"] = mqtt_qos
+            # Prepare publish parameters with QoS converted to the proper enum
+            publish_params = {"topic": topic, "payload": payload, "qos": QOS_LEVELS[min(qos, 1)]}
 
             # Debug publish parameters
-            debug_mode = getattr(self, "debug_mode", False)
-            if debug_mode:
+            if self.debug_mode:
                 print("🔍 DEBUG: Publish parameters:")
                 print(f"   Topic: {publish_params['topic']}")
                 print(f"   QoS: {publish_params['qos']}")
                 print(f"   Payload length: {len(publish_params['payload'])}")
 
+            self.inflight_publishes.acquire()
+            acquired = True
             publish_future, packet_id = self.connection.publish(**publish_params)
 
-            # Wait for publish to complete
-            publish_future.result()
-
             message_info = {
                 "Direction": "SENT",
                 "Topic": topic,
                 "QoS": qos,
                 "Packet ID": packet_id,
-                "Payload Size": f"{len(payload)} bytes",
-                "Timestamp": datetime.now().isoformat(),
+                "Payload Size": payload_size,
+                "Timestamp": None,
                 "Payload": payload,
                 "Content Type": content_type,
                 "User Properties": user_properties,
@@ -949,56 +1256,137 @@ class MQTTClientExplorer:
                 "Response Topic": response_topic,
             }
 
+            # Confirmation runs on the CRT thread once the publish completes
+            publish_future.add_done_callback(lambda future: self.on_publish_complete(future, message_info, on_complete))
+            return publish_future, packet_id
+
+        except Exception as e:
+            if acquired:
+                self.inflight_publishes.release()
+            self.print_publish_error(topic, e, payload)
+            return None, None
+
+    def on_publish_complete(self, future, message_info, on_complete=None):
+        """Callback for completed publishes: record the message and print the confirmation"""
+        try:
+            error = future.exception()
+            if error:
+                self.print_publish_error(message_info["Topic"], error, message_info["Payload"])
+                return
+
+            message_info["Timestamp"] = time.time()
             with self.message_lock:
                 self.sent_messages.append(message_info)
 
             # Enhanced publish confirmation with protocol details
-            timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-            print(get_message("published_timestamp").format(timestamp))
-            print(f"   📤 Topic: {topic}")
-            print(f"   🏷️  QoS: {qos} | Packet ID: {packet_id}")
-            print(f"   📊 Size: {len(payload)} bytes | Type: {content_type}")
-            if qos > 0:
-                print(f"   {get_message('delivery_ack_required').format(qos)}")
-            else:
-                print(f"   {get_message('delivery_fire_forget')}")
+            qos = message_info["QoS"]
+            timestamp = format_clock()
+            delivery = get_message("delivery_ack_required").format(qos) if qos > 0 else get_message("delivery_fire_forget")
+            lines = [
+                get_message("published_timestamp").format(timestamp),
+                f"   📤 Topic: {message_info['Topic']}",
+                f"   🏷️  QoS: {qos} | Packet ID: {message_info['Packet ID']}",
+                f"   📊 Size: {message_info['Payload Size']} | Type: {message_info['Content Type']}",
+                f"   {delivery}",
+            ]
+            sys.stdout.write("\n".join(lines) + "\n")
+        finally:
+            self.inflight_publishes.release()
+            if on_complete:
+                on_complete(future)
+
+    def print_publish_error(self, topic, e, payload):
+        """Print a publish failure with troubleshooting hints"""
+        print(f"{get_message('publish_failed')} {str(e)}")
+        print(get_message("detailed_error_info"))
+        print(f"{get_message('error_type_label')} {type(e).__name__}")
+        print(f"{get_message('error_message_label')} {str(e)}")
+
+        # Check for common issues
+        error_str = str(e).lower()
+        if "timeout" in error_str:
+            print(get_message("troubleshooting_publish_timeout"))
+            for reason in get_message("timeout_reasons"):
+                print(reason)
+        elif "not authorized" in error_str or "forbidden" in error_str or "access denied" in error_str:
+            print(get_message("troubleshooting_auth"))
+            for reason in get_message("auth_reasons"):
+                print(reason)
+        elif "invalid topic" in error_str or "malformed" in error_str:
+            print(get_message("troubleshooting_invalid_topic"))
+            for reason in get_message("invalid_topic_reasons"):
+                print(reason)
+        elif "payload too large" in error_str:
+            print(get_message("troubleshooting_payload_large"))
+            print(get_message("payload_limit_msg"))
+            print(get_message("current_payload_size").format(len(payload)))
+        elif "connection" in error_str or "disconnected" in error_str:
+            print(get_message("troubleshooting_connection"))
+            for reason in get_message("connection_reasons"):
+                print(reason)
+        else:
+            print(get_message("troubleshooting_unknown"))
+            for reason in get_message("unknown_reasons"):
+                print(reason.format(topic))
+
+    def submit_publish(self, topic, message, qos=0):
+        """Publish a message now, or queue it for the batch publisher when batch mode is on"""
+        if not self.batch_mode:
+            return self.publish_message(topic, message, qos)
+        if not self.connected:
+            print(get_message("not_connected_iot"))
+            return False
+        self.publish_queue.put((topic, message, qos))
+        return True
 
-            return True
+    def publish_worker_loop(self):
+        """Publish queued messages in batches, waiting for every publish in a batch to complete before reporting it"""
+        while True:
+            batch = [self.publish_queue.get()]
+            while len(batch) < PUBLISH_BATCH_SIZE:
+                try:
+                    batch.append(self.publish_queue.get_nowait())
+                except queue.Empty:
+                    break
 
-        except Exception as e:
-            print(f"{get_message('publish_failed')} {str(e)}")
-            print(get_message("detailed_error_info"))
-            print(f"{get_message('error_type_label')} {type(e).__name__}")
-            print(f"{get_message('error_message_label')} {str(e)}")
+            pending = []
+            flush_events = []
+            for item in batch:
+                # Flush markers are set once everything queued ahead of them has completed
+                if isinstance(item, threading.Event):
+                    flush_events.append(item)
+                    continue
+                # Messages queued before a disconnect are dropped rather than reported one by one
+                if not self.connected:
+                    continue
+                topic, message, qos = item
+                completed = threading.Event()
+                future, _ = self.publish_message_async(
+                    topic, message, qos, on_complete=lambda future, done=completed: done.set()
+                )
+                if future is not None:
+                    pending.append((future, completed))
 
-            # Check for common issues
-            error_str = str(e).lower()
-            if "timeout" in error_str:
-                print(get_message("troubleshooting_publish_timeout"))
-                for reason in get_message("timeout_reasons"):
-                    print(reason)
-            elif "not authorized" in error_str or "forbidden" in error_str or "access denied" in error_str:
-                print(get_message("troubleshooting_auth"))
-                for reason in get_message("auth_reasons"):
-                    print(reason)
-            elif "invalid topic" in error_str or "malformed" in error_str:
-                print(get_message("troubleshooting_invalid_topic"))
-                for reason in get_message("invalid_topic_reasons"):
-                    print(reason)
-            elif "payload too large" in error_str:
-                print(get_message("troubleshooting_payload_large"))
-                print(get_message("payload_limit_msg"))
-                print(get_message("current_payload_size").format(len(payload)))
-            elif "connection" in error_str or "disconnected" in error_str:
-                print(get_message("troubleshooting_connection"))
-                for reason in get_message("connection_reasons"):
-                    print(reason)
-            else:
-                print(get_message("troubleshooting_unknown"))
-                for reason in get_message("unknown_reasons"):
-                    print(reason.format(topic))
+            # Wait for the completion callbacks, so confirmations, history and in-flight slots are settled first
+            sent = 0
+            for future, completed in pending:
+                completed.wait()
+                if future.exception() is None:
+                    sent += 1
 
-            return False
+            # Failures are already reported by on_publish_complete, so only successes are counted here
+            if sent:
+                sys.stdout.write(f"\n{get_message('batch_published').format(sent)}\n{get_message('mqtt_prompt')}")
+                sys.stdout.flush()
+
+            for event in flush_events:
+                event.set()
+
+    def flush_publishes(self, timeout=FLUSH_TIMEOUT):
+        """Wait until every message queued for the batch publisher so far has been sent; returns False on timeout"""
+        done = threading.Event()
+        self.publish_queue.put(done)
+        return done.wait(timeout)
 
 
 def main():
@@ -1012,6 +1400,7 @@ def main():
     # Get user's preferred language
     USER_LANG = get_language()
     messages = load_messages("mqtt_client_explorer", USER_LANG)
+    _msg_static.cache_clear()
 
     # Display header
     print(f"\n{get_message('title')}")
@@ -1028,11 +1417,12 @@ def main():
     else:
         print(f"\n{get_message('tip')}")
 
-    # Display AWS context
-    display_aws_context()
-
     # Initialize MQTT client
     mqtt_client = MQTTClientExplorer()
+    mqtt_client.debug_mode = DEBUG_MODE
+
+    # Display AWS context
+    display_aws_context(mqtt_client)
 
     try:
         while True:
@@ -8,11 +8,13 @@ Educational MQTT client using WebSocket connection with SigV4 authentication.
 """
 import json
 import os
+import re
 import sys
 import threading
 import traceback
-import uuid
+from collections import deque
 from datetime import datetime
+from functools import cached_property, lru_cache
 
 # Add i18n to path
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "i18n"))
@@ -28,6 +30,14 @@ try:
 except ImportError:
     MQTT5_AVAILABLE = False
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from kv_parser import parse_kv
 from language_selector import get_language
 from loader import load_messages
 
@@ -36,10 +46,29 @@ USER_LANG = "en"
 messages = {}
 DEBUG_MODE = False
 
+# Sent and received messages kept for the history command; older ones are dropped
+RECENT_MESSAGE_LIMIT = 200
+MESSAGE_PREVIEW_LENGTH = 50
+
+# AWS IoT Core supports QoS 0 and 1, so higher requests are sent as QoS 1
+QOS_LEVELS = (mqtt.QoS.AT_MOST_ONCE, mqtt.QoS.AT_LEAST_ONCE)
+
+# ANSI erase display + cursor home, used by the clear command
+CLEAR_SCREEN = "\033[2J\033[H"
+
+# Characters AWS IoT accepts in an MQTT client ID
+CLIENT_ID_PATTERN = re.compile(r"[a-zA-Z0-9_-]+")
+
+
+@lru_cache(maxsize=None)
+def _msg_static(key):
+    """Resolve a message key once per loaded language; cleared when messages are reloaded"""
+    return messages.get(key, key)
+
 
 def get_message(key, *args):
     """Get localized message with optional formatting"""
-    msg = messages.get(key, key)
+    msg = _msg_static(key)
     if args:
         return msg.format(*args)
     return msg
@@ -49,11 +78,25 @@ class MQTTWebSocketExplorer:
     def __init__(self):
         self.connection = None
         self.connected = False
-        self.received_messages = []
-        self.sent_messages = []
+        # (direction, clock, topic, qos, payload preview) tuples, oldest first
+        self.recent_messages = deque(maxlen=RECENT_MESSAGE_LIMIT)
         self.subscriptions = {}
         self.message_lock = threading.Lock()
         self.message_count = 0
+        self.command_handlers = {
+            "help": self.command_help,
+            "status": self.command_status,
+            "sub": self.command_sub,
+            "sub1": lambda parts: self.command_sub(parts, qos=1),
+            "pub": self.command_pub,
+            "pub1": lambda parts: self.command_pub(parts, qos=1),
+            "json": self.command_json,
+            "unsub": self.command_unsub,
+            "test": self.command_test,
+            "messages": self.command_messages,
+            "debug": self.command_debug,
+            "clear": self.command_clear,
+        }
         self.debug_mode = False
 
     def get_iot_endpoint(self, debug=False):
@@ -141,7 +184,7 @@ class MQTTWebSocketExplorer:
                 custom_id = input(f"\n{get_message('client_id_prompt')}").strip()
 
                 if not custom_id:
-                    client_id = f"websocket-client-{uuid.uuid4().hex[:8]}"
+                    client_id = f"websocket-client-{os.urandom(4).hex()}"
                     print(f"   {get_message('client_id_auto_generated')}: {client_id}")
                     return client_id
                 else:
@@ -158,11 +201,9 @@ class MQTTWebSocketExplorer:
 
     def validate_client_id(self, client_id):
         """Validate MQTT Client ID according to AWS IoT requirements"""
-        if not client_id or len(client_id) < 1 or len(client_id) > 128:
+        if not client_id or len(client_id) > 128:
             return False
-        import re
-
-        return bool(re.match(r"^[a-zA-Z0-9_-]+$", client_id))
+        return CLIENT_ID_PATTERN.fullmatch(client_id) is not None
 
     def select_mqtt_version(self):
         """Allow user to select MQTT version"""
@@ -296,16 +337,20 @@ class MQTTWebSocketExplorer:
                 payload_display = payload.decode("utf-8")
                 is_json = False
 
+            now = datetime.now()
             with self.message_lock:
                 self.message_count += 1
+                self.recent_messages.append(
+                    ("📥", now.strftime("%H:%M:%S"), topic, qos, payload_display[:MESSAGE_PREVIEW_LENGTH])
+                )
 
-            timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+            timestamp = now.strftime("%H:%M:%S.%f")[:-3]
             print("\n" + "=" * 70)
             print(f"{get_message('incoming_message', self.message_count, timestamp)}")
             print("=" * 70)
 
             print(f"{get_message('topic')}: {topic}")
-            qos_desc = get_message("qos_descriptions").get(qos, f"QoS {qos}")
+            qos_desc = get_message("qos_descriptions").get(str(int(qos)), f"QoS {int(qos)}")
             print(f"{get_message('qos')}: {qos} ({qos_desc})")
             print(f"{get_message('payload_size')}: {len(payload)} {get_message('bytes')}")
             print(get_message("transport"))
@@ -328,9 +373,7 @@ class MQTTWebSocketExplorer:
         print(f"\n🔧 Step 2: {get_message('interactive_messaging')}")
         print("-" * 50)
 
-        print(get_message("mqtt_topic_guidelines"))
-        for guideline in get_message("topic_guidelines"):
-            print(f"   {guideline}")
+        sys.stdout.write(self.topic_guidelines_text)
 
         # Get subscription topic
         while True:
@@ -361,10 +404,7 @@ class MQTTWebSocketExplorer:
         print(f"\n{get_message('interactive_websocket_mode')}")
         print(get_message("messages_appear_immediately"))
 
-        print(f"\n{get_message('commands')}")
-        for command in get_message("command_list"):
-            print(f"   {command}")
-        print("\n" + "=" * 60)
+        sys.stdout.write(f"\n{get_message('commands')}\n{self.command_list_text}\n{'=' * 60}\n")
 
         while True:
             try:
@@ -378,92 +418,10 @@ class MQTTWebSocketExplorer:
 
                 if cmd == "quit":
                     break
-                elif cmd == "help":
-                    print("\n📖 Available Commands:")
-                    for command_help in get_message("command_list"):
-                        print(f"   {command_help}")
-                elif cmd == "status":
-                    print(f"\n📊 {get_message('connection_status_label')}:")
-                    print(f"   {get_message('connected')}: {'✅ Yes' if self.connected else '❌ No'}")
-                    print("   Transport: WebSocket with SigV4")
-                    print(f"   {get_message('subscriptions_count', len(self.subscriptions))}")
-                elif cmd in ["sub", "sub1"]:
-                    if len(parts) < 2:
-                        print("   ❌ Usage: sub <topic>")
-                        continue
-                    topic = parts[1]
-                    qos = 1 if cmd == "sub1" else 0
-                    if self.subscribe_to_topic(topic, qos):
-                        print(f"   ✅ Successfully subscribed to {topic} with QoS {qos}")
-                elif cmd in ["pub", "pub1"]:
-                    if len(parts) < 3:
-                        print("   ❌ Usage: pub <topic> <message>")
-                        continue
-                    topic = parts[1]
-                    message = " ".join(parts[2:]).strip("'\"")
-                    qos = 1 if cmd == "pub1" else 0
-                    self.publish_message(topic, message, qos)
-                elif cmd == "json":
-                    if len(parts) < 3:
-                        print("   ❌ Usage: json <topic> key=val key2=val2...")
-                        continue
-                    topic = parts[1]
-                    # Parse key=value pairs into JSON
-                    json_data = {}
-                    for pair in parts[2:]:
-                        if "=" in pair:
-                            key, value = pair.split("=", 1)
-                            # Try to parse as number or boolean
-                            if value.lower() == "true":
-                                json_data[key] = True
-                            elif value.lower() == "false":
-                                json_data[key] = False
-                            elif value.isdigit():
-                                json_data[key] = int(value)
-                            else:
-                                try:
-                                    json_data[key] = float(value)
-                                except ValueError:
-                                    json_data[key] = value
-                    self.publish_message(topic, json_data, 0)
-                elif cmd == "unsub":
-                    if len(parts) < 2:
-                        print("   ❌ Usage: unsub <topic>")
-                        continue
-                    topic = parts[1]
-                    print(f"   ℹ️  Unsubscribe functionality not yet implemented for WebSocket")
-                elif cmd == "test":
-                    # Send a test message
-                    test_topic = f"test/websocket/message"
-                    test_message = {
-                        "timestamp": datetime.now().isoformat(),
-                        "message": "Hello from WebSocket MQTT Explorer!",
-                        "transport": "WebSocket with SigV4",
-                    }
-                    self.publish_message(test_topic, test_message, 0)
-                elif cmd == "messages":
-                    print(f"\n📊 {get_message('message_history')}")
-                    if self.received_messages:
-                        for i, msg in enumerate(self.received_messages[-10:], 1):
-                            print(f"   {i}. {msg}")
-                    else:
-                        print("   No messages received yet")
-                elif cmd == "debug":
-                    if len(parts) > 1:
-                        topic = parts[1]
-                        print(f"\n🔍 Debug info for topic: {topic}")
-                        if topic in self.subscriptions:
-                            print(f"   Subscription exists: {self.subscriptions[topic]}")
-                        else:
-                            print(f"   Not subscribed to {topic}")
-                    else:
-                        print(f"\n🔍 {get_message('connection_diagnostics')}")
-                        print(f"   Connected: {self.connected}")
-                        print(f"   Subscriptions: {len(self.subscriptions)}")
-                        print(f"   Messages received: {len(self.received_messages)}")
-                elif cmd == "clear":
-                    print("\n" * 50)
-                    print(get_message("clear_screen"))
+
+                handler = self.command_handlers.get(cmd)
+                if handler:
+                    handler(parts)
                 else:
                     print(f"   {get_message('invalid_command')}")
 
@@ -471,6 +429,109 @@ class MQTTWebSocketExplorer:
                 print("\n\n🛑 Interrupted by user")
                 break
 
+    @cached_property
+    def topic_guidelines_text(self):
+        """Localized topic guidelines, built once per session"""
+        lines = [get_message("mqtt_topic_guidelines")]
+        lines.extend(f"   {guideline}" for guideline in get_message("topic_guidelines"))
+        return "\n".join(lines) + "\n"
+
+    @cached_property
+    def command_list_text(self):
+        """Localized command list, built once per session"""
+        return "".join(f"   {command}\n" for command in get_message("command_list"))
+
+    def command_help(self, parts):
+        """Show the available interactive commands"""
+        sys.stdout.write(f"\n📖 Available Commands:\n{self.command_list_text}")
+
+    def command_status(self, parts):
+        """Show the WebSocket connection status"""
+        lines = [
+            f"\n📊 {get_message('connection_status_label')}:",
+            f"   {get_message('connected')}: {'✅ Yes' if self.connected else '❌ No'}",
+            "   Transport: WebSocket with SigV4",
+            f"   {get_message('subscriptions_count', len(self.subscriptions))}",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def command_sub(self, parts, qos=0):
+        """Subscribe to the topic given on the command line"""
+        if len(parts) < 2:
+            print("   ❌ Usage: sub <topic>")
+            return
+        topic = parts[1]
+        if self.subscribe_to_topic(topic, qos):
+            print(f"   ✅ Successfully subscribed to {topic} with QoS {qos}")
+
+    def command_pub(self, parts, qos=0):
+        """Publish the text message given on the command line"""
+        if len(parts) < 3:
+            print("   ❌ Usage: pub <topic> <message>")
+            return
+        topic = parts[1]
+        message = " ".join(parts[2:]).strip("'\"")
+        self.publish_message(topic, message, qos)
+
+    def command_json(self, parts):
+        """Publish key=value pairs from the command line as a JSON object"""
+        if len(parts) < 3:
+            print("   ❌ Usage: json <topic> key=val key2=val2...")
+            return
+        topic = parts[1]
+        json_data = parse_kv(parts[2])
+        self.publish_message(topic, json_data, 0)
+
+    def command_unsub(self, parts):
+        """Unsubscribe from a topic (not yet supported over WebSocket)"""
+        if len(parts) < 2:
+            print("   ❌ Usage: unsub <topic>")
+            return
+        print("   ℹ️  Unsubscribe functionality not yet implemented for WebSocket")
+
+    def command_test(self, parts):
+        """Send a test message"""
+        test_topic = "test/websocket/message"
+        test_message = {
+            "timestamp": datetime.now().isoformat(),
+            "message": "Hello from WebSocket MQTT Explorer!",
+            "transport": "WebSocket with SigV4",
+        }
+        self.publish_message(test_topic, test_message, 0)
+
+    def command_messages(self, parts):
+        """Show the most recent sent and received messages"""
+        lines = [f"\n📊 {get_message('message_history')}"]
+        if self.recent_messages:
+            for i, (direction, clock, topic, qos, preview) in enumerate(list(self.recent_messages)[-10:], 1):
+                lines.append(f"   {i}. {direction} [{clock}] {topic}: {preview}")
+        else:
+            lines.append("   No messages received yet")
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def command_debug(self, parts):
+        """Show connection diagnostics or details for one topic"""
+        if len(parts) > 1:
+            topic = parts[1]
+            lines = [f"\n🔍 Debug info for topic: {topic}"]
+            if topic in self.subscriptions:
+                lines.append(f"   Subscription exists: {self.subscriptions[topic]}")
+            else:
+                lines.append(f"   Not subscribed to {topic}")
+        else:
+            lines = [
+                f"\n🔍 {get_message('connection_diagnostics')}",
+                f"   Connected: {self.connected}",
+                f"   Subscriptions: {len(self.subscriptions)}",
+                f"   Messages received: {self.message_count}",
+            ]
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def command_clear(self, parts):
+        """Clear the screen"""
+        sys.stdout.write(CLEAR_SCREEN)
+        print(get_message("clear_screen"))
+
     def subscribe_to_topic(self, topic, qos=0):
         """Subscribe to an MQTT topic over WebSocket"""
         if not self.connected:
@@ -480,10 +541,10 @@ class MQTTWebSocketExplorer:
         try:
             print(f"\n{get_message('subscribing_topic_websocket')}")
             print(f"   {get_message('topic')}: {topic}")
-            qos_desc = get_message("qos_descriptions").get(qos, f"QoS {qos}")
+            qos_desc = get_message("qos_descriptions").get(str(int(qos)), f"QoS {int(qos)}")
             print(f"   QoS: {qos} ({qos_desc})")
 
-            mqtt_qos = mqtt.QoS.AT_MOST_ONCE if qos == 0 else mqtt.QoS.AT_LEAST_ONCE
+            mqtt_qos = QOS_LEVELS[min(qos, 1)]
             subscribe_future, packet_id = self.connection.subscribe(
                 topic=topic, qos=mqtt_qos, callback=self.on_message_received
             )
@@ -516,9 +577,9 @@ class MQTTWebSocketExplorer:
 
         try:
             if isinstance(message, dict):
-                payload = json.dumps(message)
+                payload = orjson.dumps(message) if ORJSON_AVAILABLE else json.dumps(message).encode("utf-8")
             else:
-                payload = str(message)
+                payload = str(message).encode("utf-8")
 
             print(f"\n{get_message('publishing_message_websocket')}")
             print(f"   {get_message('topic')}: {topic}")
@@ -528,11 +589,16 @@ class MQTTWebSocketExplorer:
             publish_future, packet_id = self.connection.publish(
                 topic=topic,
                 payload=payload,
-                qos=mqtt.QoS.AT_MOST_ONCE if qos == 0 else mqtt.QoS.AT_LEAST_ONCE,
+                qos=QOS_LEVELS[min(qos, 1)],
             )
             publish_future.result()
 
-            timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+            now = datetime.now()
+            with self.message_lock:
+                preview = payload[:MESSAGE_PREVIEW_LENGTH].decode("utf-8", "ignore")
+                self.recent_messages.append(("📤", now.strftime("%H:%M:%S"), topic, qos, preview))
+
+            timestamp = now.strftime("%H:%M:%S.%f")[:-3]
             print(f"{get_message('published_websocket', timestamp)}")
 
             return True
@@ -560,6 +626,7 @@ def main():
     try:
         USER_LANG = get_language()
         messages = load_messages("mqtt_websocket_explorer", USER_LANG)
+        _msg_static.cache_clear()
 
         debug_mode = "--debug" in sys.argv or "-d" in sys.argv
         DEBUG_MODE = debug_mode